@@ -1,11 +1,46 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import time
 from datetime import date
+import itertools
 from typing import List, Optional
+from cachetools import TTLCache
 from pydantic import BaseModel
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
+# In-process response cache for read-mostly GET endpoints: serialized bytes
+# are cached per path+query and dropped whenever any write request lands.
+_CACHE_MAX_AGE = {"/api/categories": 60}
+# Bounded and self-expiring: distinct query strings would otherwise
+# accumulate until the next write clears the whole dict.
+_response_cache = TTLCache(maxsize=256, ttl=max(_CACHE_MAX_AGE.values()))
+
+@app.middleware("http")
+async def cache_responses(request: Request, call_next):
+    if request.method == "GET":
+        max_age = _CACHE_MAX_AGE.get(request.url.path)
+        if max_age is not None:
+            key = f"{request.url.path}?{request.url.query}"
+            hit = _response_cache.get(key)
+            if hit is not None and time.monotonic() - hit[1] < max_age:
+                return Response(content=hit[0], media_type="application/json")
+            response = await call_next(request)
+            if response.status_code == 200:
+                body = b"".join([chunk async for chunk in response.body_iterator])
+                _response_cache[key] = (body, time.monotonic())
+                return Response(content=body, status_code=response.status_code,
+                                headers=dict(response.headers))
+            return response
+        return await call_next(request)
+    response = await call_next(request)
+    if request.method in ("POST", "PUT", "PATCH", "DELETE"):
+        _response_cache.clear()
+    return response
+
+# Registered after the cache middleware so CORS stays outermost (the stack
+# is built last-registered-first) and cache hits still get CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -29,30 +64,28 @@ class Transaction(BaseModel):
 
 categories_db = {}
 transactions_db = {}
-next_cat_id = 1
-next_txn_id = 1
+_cat_ids = itertools.count(1)
+_txn_ids = itertools.count(1)
 
 @app.get("/api/categories", response_model=List[Category])
-def get_categories():
+async def get_categories():
     return list(categories_db.values())
 
 @app.post("/api/categories", response_model=Category)
-def create_category(category: Category):
-    global next_cat_id
-    category.id = next_cat_id
-    categories_db[next_cat_id] = category
-    next_cat_id += 1
+async def create_category(category: Category):
+    category.id = next(_cat_ids)
+    categories_db[category.id] = category
     return category
 
 @app.put("/api/categories/{id}", response_model=Category)
-def update_category(id: int, budget: float):
+async def update_category(id: int, budget: float):
     if id not in categories_db:
         raise HTTPException(status_code=404, detail="Category not found")
     categories_db[id].budget = budget
     return categories_db[id]
 
 @app.get("/api/transactions", response_model=List[Transaction])
-def get_transactions(start_date: Optional[date] = None, end_date: Optional[date] = None):
+async def get_transactions(start_date: Optional[date] = None, end_date: Optional[date] = None):
     txn_list = list(transactions_db.values())
     if start_date:
         txn_list = [t for t in txn_list if t.date >= start_date]
@@ -61,15 +94,13 @@ def get_transactions(start_date: Optional[date] = None, end_date: Optional[date]
     return txn_list
 
 @app.post("/api/transactions", response_model=Transaction)
-def create_transaction(transaction: Transaction):
-    global next_txn_id
-    transaction.id = next_txn_id
-    transactions_db[next_txn_id] = transaction
-    next_txn_id += 1
+async def create_transaction(transaction: Transaction):
+    transaction.id = next(_txn_ids)
+    transactions_db[transaction.id] = transaction
     return transaction
 
 @app.put("/api/transactions/{id}", response_model=Transaction)
-def update_transaction(id: int, transaction: Transaction):
+async def update_transaction(id: int, transaction: Transaction):
     if id not in transactions_db:
         raise HTTPException(status_code=404, detail="Transaction not found")
     transaction.id = id
@@ -77,16 +108,18 @@ def update_transaction(id: int, transaction: Transaction):
     return transaction
 
 @app.delete("/api/transactions/{id}")
-def delete_transaction(id: int):
+async def delete_transaction(id: int):
     if id not in transactions_db:
         raise HTTPException(status_code=404, detail="Transaction not found")
     del transactions_db[id]
     return {"message": "Transaction deleted"}
 
 @app.get("/api/budget-progress")
-def get_budget_progress():
-    progress = []
-    for cat_id, cat in categories_db.items():
-        spent = sum(t.amount for t in transactions_db.values() if t.category_id == cat_id and t.type == "expense")
-        progress.append({"category_id": cat_id, "category_name": cat.name, "budget": cat.budget, "spent": spent})
-    return progress
\ No newline at end of file
+async def get_budget_progress():
+    spent = {}
+    for t in transactions_db.values():
+        if t.type == "expense":
+            spent[t.category_id] = spent.get(t.category_id, 0.0) + t.amount
+    return [{"category_id": cat_id, "category_name": cat.name, "budget": cat.budget,
+             "spent": spent.get(cat_id, 0.0)}
+            for cat_id, cat in categories_db.items()]
\ No newline at end of file
@@ -1,11 +1,14 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from datetime import datetime
+from operator import add, mul, sub, truediv
 from typing import List, Optional
+import msgspec
 import uuid
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,11 +20,14 @@ app.add_middleware(
 
 calculations = {}
 
-class CalculationRequest(BaseModel):
+class CalculationRequest(msgspec.Struct):
     operand1: float
     operand2: float
     operation: str
 
+_calc_decoder = msgspec.json.Decoder(CalculationRequest)
+_OPS = {"add": add, "subtract": sub, "multiply": mul, "divide": truediv}
+
 class CalculationResponse(BaseModel):
     id: str
     operand1: float
@@ -31,26 +37,24 @@ class CalculationResponse(BaseModel):
     created_at: datetime
 
 @app.post("/api/calculate", response_model=CalculationResponse)
-def calculate(request: CalculationRequest):
-    if request.operation == "add":
-        result = request.operand1 + request.operand2
-    elif request.operation == "subtract":
-        result = request.operand1 - request.operand2
-    elif request.operation == "multiply":
-        result = request.operand1 * request.operand2
-    elif request.operation == "divide":
-        if request.operand2 == 0:
-            raise HTTPException(status_code=400, detail="Division by zero")
-        result = request.operand1 / request.operand2
-    else:
+async def calculate(request: Request):
+    try:
+        req = _calc_decoder.decode(await request.body())
+    except (msgspec.ValidationError, msgspec.DecodeError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    op = _OPS.get(req.operation)
+    if op is None:
         raise HTTPException(status_code=400, detail="Invalid operation")
+    if req.operation == "divide" and req.operand2 == 0:
+        raise HTTPException(status_code=400, detail="Division by zero")
+    result = op(req.operand1, req.operand2)
     
-    calc_id = str(uuid.uuid4())
+    calc_id = uuid.uuid4().hex
     calc = CalculationResponse(
         id=calc_id,
-        operand1=request.operand1,
-        operand2=request.operand2,
-        operation=request.operation,
+        operand1=req.operand1,
+        operand2=req.operand2,
+        operation=req.operation,
         result=result,
         created_at=datetime.now()
     )
@@ -58,23 +62,23 @@ def calculate(request: CalculationRequest):
     return calc
 
 @app.get("/api/calculations", response_model=List[CalculationResponse])
-def get_calculations():
+async def get_calculations():
     return list(calculations.values())
 
 @app.get("/api/calculations/{id}", response_model=CalculationResponse)
-def get_calculation(id: str):
+async def get_calculation(id: str):
     if id not in calculations:
         raise HTTPException(status_code=404, detail="Calculation not found")
     return calculations[id]
 
 @app.delete("/api/calculations/{id}")
-def delete_calculation(id: str):
+async def delete_calculation(id: str):
     if id not in calculations:
         raise HTTPException(status_code=404, detail="Calculation not found")
     del calculations[id]
     return {"message": "Calculation deleted"}
 
 @app.delete("/api/calculations")
-def clear_calculations():
+async def clear_calculations():
     calculations.clear()
     return {"message": "All calculations cleared"}
@@ -1,11 +1,14 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List
 from datetime import datetime, timedelta
+import itertools
 import random
+import numpy as np
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,14 +18,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+CONDITIONS = ("Sunny", "Cloudy", "Rainy", "Snowy")
+ICONS = ("☀️", "☁️", "🌧️", "❄️")
+rng = np.random.default_rng()
+
 cities_db = [
     {"id": 1, "name": "London", "country": "UK", "lat": 51.5074, "lon": -0.1278},
     {"id": 2, "name": "New York", "country": "US", "lat": 40.7128, "lon": -74.0060},
     {"id": 3, "name": "Tokyo", "country": "JP", "lat": 35.6762, "lon": 139.6503},
 ]
+for c in cities_db:
+    c["name_lower"] = c["name"].lower()
+cities_by_id = {c["id"]: c for c in cities_db}
 
 weather_db = {}
-favorites_db = []
+favorites_db = {}  # fav_id -> favorite
+favorites_by_user = {}
+_fav_ids = itertools.count(1)
 unit_pref = "C"
 
 class City(BaseModel):
@@ -55,11 +67,12 @@ class UnitToggle(BaseModel):
 
 @app.get("/api/cities/search")
 async def search_cities(q: str) -> List[City]:
-    return [city for city in cities_db if q.lower() in city["name"].lower()]
+    ql = q.lower()
+    return [city for city in cities_db if ql in city["name_lower"]]
 
 @app.get("/api/weather/current")
 async def get_current_weather(city_id: int) -> Weather:
-    city = next((c for c in cities_db if c["id"] == city_id), None)
+    city = cities_by_id.get(city_id)
     if not city:
         raise HTTPException(status_code=404, detail="City not found")
     if city_id not in weather_db:
@@ -78,19 +91,24 @@ async def get_current_weather(city_id: int) -> Weather:
 
 @app.get("/api/weather/forecast")
 async def get_forecast(city_id: int) -> List[Weather]:
-    city = next((c for c in cities_db if c["id"] == city_id), None)
+    city = cities_by_id.get(city_id)
     if not city:
         raise HTTPException(status_code=404, detail="City not found")
+    temps = rng.uniform(5, 30, 5).round(1)
+    humidities = rng.integers(30, 91, 5)
+    winds = rng.uniform(0, 15, 5).round(1)
+    condition_idx = rng.integers(0, len(CONDITIONS), 5)
+    base = datetime.now()
     forecast = []
     for i in range(5):
-        day = datetime.now() + timedelta(days=i)
+        day = base + timedelta(days=i)
         forecast.append({
             "city_id": city_id,
-            "temperature": round(random.uniform(5, 30), 1),
-            "conditions": random.choice(["Sunny", "Cloudy", "Rainy", "Snowy"]),
-            "humidity": random.randint(30, 90),
-            "wind_speed": round(random.uniform(0, 15), 1),
-            "icon": random.choice(["☀️", "☁️", "🌧️", "❄️"]),
+            "temperature": float(temps[i]),
+            "conditions": CONDITIONS[condition_idx[i]],
+            "humidity": int(humidities[i]),
+            "wind_speed": float(winds[i]),
+            "icon": ICONS[condition_idx[i]],
             "unit": unit_pref,
             "timestamp": day
         })
@@ -98,35 +116,36 @@ async def get_forecast(city_id: int) -> List[Weather]:
 
 @app.post("/api/favorites")
 async def add_favorite(city_id: int, user_id: int = 1):
-    city = next((c for c in cities_db if c["id"] == city_id), None)
+    city = cities_by_id.get(city_id)
     if not city:
         raise HTTPException(status_code=404, detail="City not found")
-    fav_id = max([f["id"] for f in favorites_db], default=0) + 1
+    fav_id = next(_fav_ids)
     favorite = {"id": fav_id, "user_id": user_id, "city_id": city_id, "created_at": datetime.now()}
-    favorites_db.append(favorite)
+    favorites_db[fav_id] = favorite
+    favorites_by_user.setdefault(user_id, []).append(favorite)
     return favorite
 
 @app.get("/api/favorites")
 async def get_favorites(user_id: int = 1) -> List[FavoriteOut]:
     result = []
-    for fav in favorites_db:
-        if fav["user_id"] == user_id:
-            city = next((c for c in cities_db if c["id"] == fav["city_id"]), None)
-            if city:
-                result.append({
-                    "id": fav["id"],
-                    "user_id": fav["user_id"],
-                    "city_id": fav["city_id"],
-                    "city_name": city["name"],
-                    "country": city["country"],
-                    "created_at": fav["created_at"]
-                })
+    for fav in favorites_by_user.get(user_id, []):
+        city = cities_by_id.get(fav["city_id"])
+        if city:
+            result.append({
+                "id": fav["id"],
+                "user_id": fav["user_id"],
+                "city_id": fav["city_id"],
+                "city_name": city["name"],
+                "country": city["country"],
+                "created_at": fav["created_at"]
+            })
     return result
 
 @app.delete("/api/favorites/{fav_id}")
 async def delete_favorite(fav_id: int):
-    global favorites_db
-    favorites_db = [f for f in favorites_db if f["id"] != fav_id]
+    favorite = favorites_db.pop(fav_id, None)
+    if favorite is not None:
+        favorites_by_user[favorite["user_id"]].remove(favorite)
     return {"message": "Favorite deleted"}
 
 @app.put("/api/weather/unit")
@@ -1,11 +1,45 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import time
+from cachetools import TTLCache
 from pydantic import BaseModel
 from datetime import datetime
 import uuid
 
-app = FastAPI()
-
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# In-process response cache for read-mostly GET endpoints: serialized bytes
+# are cached per path+query and dropped whenever any write request lands.
+_CACHE_MAX_AGE = {"/api/courses": 60}
+# Bounded and self-expiring: distinct query strings would otherwise
+# accumulate until the next write clears the whole dict.
+_response_cache = TTLCache(maxsize=256, ttl=max(_CACHE_MAX_AGE.values()))
+
+@app.middleware("http")
+async def cache_responses(request: Request, call_next):
+    if request.method == "GET":
+        max_age = _CACHE_MAX_AGE.get(request.url.path)
+        if max_age is not None:
+            key = f"{request.url.path}?{request.url.query}"
+            hit = _response_cache.get(key)
+            if hit is not None and time.monotonic() - hit[1] < max_age:
+                return Response(content=hit[0], media_type="application/json")
+            response = await call_next(request)
+            if response.status_code == 200:
+                body = b"".join([chunk async for chunk in response.body_iterator])
+                _response_cache[key] = (body, time.monotonic())
+                return Response(content=body, status_code=response.status_code,
+                                headers=dict(response.headers))
+            return response
+        return await call_next(request)
+    response = await call_next(request)
+    if request.method in ("POST", "PUT", "PATCH", "DELETE"):
+        _response_cache.clear()
+    return response
+
+# Registered after the cache middleware so CORS stays outermost (the stack
+# is built last-registered-first) and cache hits still get CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -17,6 +51,7 @@ app.add_middleware(
 courses = {}
 lessons = {}
 quizzes = {}
+quiz_answer_keys = {}  # quiz_id -> {question_id: correct_answer}
 enrollments = {}
 
 # Models
@@ -47,26 +82,26 @@ class QuizSubmission(BaseModel):
 
 # Core endpoints
 @app.get("/api/courses")
-def list_courses():
+async def list_courses():
     return list(courses.values())
 
 @app.post("/api/courses")
-def create_course(course: CourseCreate):
-    course_id = str(uuid.uuid4())
+async def create_course(course: CourseCreate):
+    course_id = uuid.uuid4().hex
     courses[course_id] = {
         "id": course_id,
         "instructor_id": course.instructor_id,
         "title": course.title,
         "description": course.description,
-        "created_at": datetime.now().isoformat()
+        "created_at": datetime.now()
     }
     return courses[course_id]
 
 @app.post("/api/courses/{course_id}/lessons")
-def add_lesson(course_id: str, lesson: LessonCreate):
+async def add_lesson(course_id: str, lesson: LessonCreate):
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    lesson_id = str(uuid.uuid4())
+    lesson_id = uuid.uuid4().hex
     lessons[lesson_id] = {
         "id": lesson_id,
         "course_id": course_id,
@@ -79,10 +114,10 @@ def add_lesson(course_id: str, lesson: LessonCreate):
     return lessons[lesson_id]
 
 @app.post("/api/lessons/{lesson_id}/quiz")
-def create_quiz(lesson_id: str, quiz: QuizCreate):
+async def create_quiz(lesson_id: str, quiz: QuizCreate):
     if lesson_id not in lessons:
         raise HTTPException(status_code=404, detail="Lesson not found")
-    quiz_id = str(uuid.uuid4())
+    quiz_id = uuid.uuid4().hex
     quizzes[quiz_id] = {
         "id": quiz_id,
         "lesson_id": lesson_id,
@@ -90,34 +125,34 @@ def create_quiz(lesson_id: str, quiz: QuizCreate):
         "questions": quiz.questions,
         "passing_score": quiz.passing_score
     }
+    quiz_answer_keys[quiz_id] = {str(q.get("id")): q.get("correct_answer") for q in quiz.questions}
     return quizzes[quiz_id]
 
 @app.post("/api/quizzes/{quiz_id}/submit")
-def submit_quiz(quiz_id: str, submission: QuizSubmission):
+async def submit_quiz(quiz_id: str, submission: QuizSubmission):
     if quiz_id not in quizzes:
         raise HTTPException(status_code=404, detail="Quiz not found")
     quiz = quizzes[quiz_id]
-    # Simple auto-grading
-    correct = 0
-    for q in quiz["questions"]:
-        if q.get("correct_answer") == submission.answers.get(str(q.get("id"))):
-            correct += 1
-    score = int((correct / len(quiz["questions"])) * 100) if quiz["questions"] else 0
+    # Simple auto-grading against the precomputed answer key
+    key = quiz_answer_keys[quiz_id]
+    correct = sum(1 for qid, answer in key.items() if submission.answers.get(qid) == answer)
+    total = len(key)
+    score = int((correct / total) * 100) if total else 0
     passed = score >= quiz["passing_score"]
-    return {"score": score, "passed": passed, "correct": correct, "total": len(quiz["questions"])}
+    return {"score": score, "passed": passed, "correct": correct, "total": total}
 
 @app.put("/api/lessons/{lesson_id}/complete")
-def mark_lesson_complete(lesson_id: str):
+async def mark_lesson_complete(lesson_id: str):
     if lesson_id not in lessons:
         raise HTTPException(status_code=404, detail="Lesson not found")
     lessons[lesson_id]["is_completed"] = True
     return lessons[lesson_id]
 
 @app.post("/api/courses/{course_id}/enroll")
-def enroll_course(course_id: str, enrollment: EnrollmentCreate):
+async def enroll_course(course_id: str, enrollment: EnrollmentCreate):
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    enrollment_id = str(uuid.uuid4())
+    enrollment_id = uuid.uuid4().hex
     enrollments[enrollment_id] = {
         "id": enrollment_id,
         "learner_id": enrollment.learner_id,
@@ -129,7 +164,7 @@ def enroll_course(course_id: str, enrollment: EnrollmentCreate):
     return enrollments[enrollment_id]
 
 @app.get("/api/learners/{learner_id}/dashboard")
-def get_dashboard(learner_id: int):
+async def get_dashboard(learner_id: int):
     learner_enrollments = [e for e in enrollments.values() if e["learner_id"] == learner_id]
     dashboard = []
     for e in learner_enrollments:
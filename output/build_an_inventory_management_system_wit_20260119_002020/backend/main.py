@@ -1,10 +1,13 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
+import itertools
+import msgspec
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,6 +20,11 @@ app.add_middleware(
 products_db = {}
 suppliers_db = {}
 stock_movements_db = {}
+product_stock = {}
+_product_ids = itertools.count(1)
+_supplier_ids = itertools.count(1)
+_movement_ids = itertools.count(1)
+movements_by_product = {}
 
 class Product(BaseModel):
     name: str
@@ -29,22 +37,17 @@ class Supplier(BaseModel):
     name: str
     contact_info: str = ""
 
-class StockMovement(BaseModel):
+class StockMovement(msgspec.Struct):
     product_id: int
     movement_type: str
     quantity: int
     supplier_id: Optional[int] = None
     notes: str = ""
 
+_movement_decoder = msgspec.json.Decoder(StockMovement)
+
 def calculate_stock(product_id: int) -> int:
-    movements = [m for m in stock_movements_db.values() if m["product_id"] == product_id]
-    stock = 0
-    for m in movements:
-        if m["movement_type"] == "purchase":
-            stock += m["quantity"]
-        else:
-            stock -= m["quantity"]
-    return stock
+    return product_stock.get(product_id, 0)
 
 def check_low_stock(product_id: int) -> bool:
     if product_id not in products_db:
@@ -54,13 +57,14 @@ def check_low_stock(product_id: int) -> bool:
     return stock <= threshold
 
 @app.get("/api/products")
-def get_products(name: Optional[str] = None, supplier_id: Optional[int] = None, low_stock: Optional[bool] = None):
+async def get_products(name: Optional[str] = None, supplier_id: Optional[int] = None, low_stock: Optional[bool] = None):
     products = list(products_db.values())
     for p in products:
         p["current_stock"] = calculate_stock(p["id"])
         p["low_stock_alert"] = check_low_stock(p["id"])
     if name:
-        products = [p for p in products if name.lower() in p["name"].lower()]
+        name_lower = name.lower()
+        products = [p for p in products if name_lower in p["name_lower"]]
     if supplier_id:
         products = [p for p in products if p["primary_supplier_id"] == supplier_id]
     if low_stock is not None:
@@ -68,7 +72,7 @@ def get_products(name: Optional[str] = None, supplier_id: Optional[int] = None,
     return products
 
 @app.get("/api/products/{product_id}/stock")
-def get_product_stock(product_id: int):
+async def get_product_stock(product_id: int):
     if product_id not in products_db:
         raise HTTPException(status_code=404, detail="Product not found")
     stock = calculate_stock(product_id)
@@ -76,75 +80,84 @@ def get_product_stock(product_id: int):
     return {"product_id": product_id, "current_stock": stock, "low_stock_alert": is_low}
 
 @app.post("/api/products")
-def create_product(product: Product):
-    product_id = len(products_db) + 1
-    now = datetime.now().isoformat()
+async def create_product(product: Product):
+    product_id = next(_product_ids)
+    now = datetime.now()
     product_data = {
         "id": product_id,
-        **product.dict(),
+        **product.model_dump(),
+        "name_lower": product.name.lower(),
         "created_at": now,
         "updated_at": now
     }
     products_db[product_id] = product_data
+    product_stock[product_id] = 0
     return product_data
 
 @app.put("/api/products/{product_id}")
-def update_product(product_id: int, product: Product):
+async def update_product(product_id: int, product: Product):
     if product_id not in products_db:
         raise HTTPException(status_code=404, detail="Product not found")
-    now = datetime.now().isoformat()
+    now = datetime.now()
     products_db[product_id].update({
-        **product.dict(),
+        **product.model_dump(),
+        "name_lower": product.name.lower(),
         "updated_at": now
     })
     return products_db[product_id]
 
 @app.delete("/api/products/{product_id}")
-def delete_product(product_id: int):
+async def delete_product(product_id: int):
     if product_id not in products_db:
         raise HTTPException(status_code=404, detail="Product not found")
     del products_db[product_id]
     return {"message": "Product deleted"}
 
 @app.get("/api/suppliers")
-def get_suppliers():
+async def get_suppliers():
     return list(suppliers_db.values())
 
 @app.post("/api/suppliers")
-def create_supplier(supplier: Supplier):
-    supplier_id = len(suppliers_db) + 1
-    now = datetime.now().isoformat()
+async def create_supplier(supplier: Supplier):
+    supplier_id = next(_supplier_ids)
+    now = datetime.now()
     supplier_data = {
         "id": supplier_id,
-        **supplier.dict(),
+        **supplier.model_dump(),
         "created_at": now
     }
     suppliers_db[supplier_id] = supplier_data
     return supplier_data
 
 @app.get("/api/stock_movements")
-def get_stock_movements(product_id: Optional[int] = None):
-    movements = list(stock_movements_db.values())
+async def get_stock_movements(product_id: Optional[int] = None):
     if product_id:
-        movements = [m for m in movements if m["product_id"] == product_id]
-    return movements
+        return movements_by_product.get(product_id, [])
+    return list(stock_movements_db.values())
 
 @app.post("/api/stock_movements")
-def create_stock_movement(movement: StockMovement):
+async def create_stock_movement(request: Request):
+    try:
+        movement = _movement_decoder.decode(await request.body())
+    except (msgspec.ValidationError, msgspec.DecodeError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
     if movement.product_id not in products_db:
         raise HTTPException(status_code=404, detail="Product not found")
     if movement.supplier_id and movement.supplier_id not in suppliers_db:
         raise HTTPException(status_code=404, detail="Supplier not found")
     if movement.quantity <= 0:
         raise HTTPException(status_code=400, detail="Quantity must be positive")
-    movement_id = len(stock_movements_db) + 1
-    now = datetime.now().isoformat()
+    movement_id = next(_movement_ids)
+    now = datetime.now()
     movement_data = {
         "id": movement_id,
-        **movement.dict(),
+        **msgspec.structs.asdict(movement),
         "created_at": now
     }
     stock_movements_db[movement_id] = movement_data
+    movements_by_product.setdefault(movement.product_id, []).append(movement_data)
+    delta = movement.quantity if movement.movement_type == "purchase" else -movement.quantity
+    product_stock[movement.product_id] = product_stock.get(movement.product_id, 0) + delta
     
     is_low = check_low_stock(movement.product_id)
     if is_low:
@@ -153,9 +166,6 @@ def create_stock_movement(movement: StockMovement):
     return movement_data
 
 @app.get("/api/inventory_valuation")
-def get_inventory_valuation():
-    valuation = 0.0
-    for product in products_db.values():
-        stock = calculate_stock(product["id"])
-        valuation += stock * product["unit_price"]
+async def get_inventory_valuation():
+    valuation = sum(product_stock.get(p["id"], 0) * p["unit_price"] for p in products_db.values())
     return {"total_valuation": valuation}
\ No newline at end of file
@@ -1,11 +1,51 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import logging
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime
+from fastapi.responses import ORJSONResponse
+import time
+from datetime import datetime, timedelta
+import itertools
 from typing import List, Optional
+from cachetools import TTLCache
 from pydantic import BaseModel
 
-app = FastAPI()
-
+logger = logging.getLogger("booking")
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+# In-process response cache for read-mostly GET endpoints: serialized bytes
+# are cached per path+query and dropped whenever any write request lands.
+_CACHE_MAX_AGE = {"/api/services": 60}
+# Bounded and self-expiring: distinct query strings would otherwise
+# accumulate until the next write clears the whole dict.
+_response_cache = TTLCache(maxsize=256, ttl=max(_CACHE_MAX_AGE.values()))
+
+@app.middleware("http")
+async def cache_responses(request: Request, call_next):
+    if request.method == "GET":
+        max_age = _CACHE_MAX_AGE.get(request.url.path)
+        if max_age is not None:
+            key = f"{request.url.path}?{request.url.query}"
+            hit = _response_cache.get(key)
+            if hit is not None and time.monotonic() - hit[1] < max_age:
+                return Response(content=hit[0], media_type="application/json")
+            response = await call_next(request)
+            if response.status_code == 200:
+                body = b"".join([chunk async for chunk in response.body_iterator])
+                _response_cache[key] = (body, time.monotonic())
+                return Response(content=body, status_code=response.status_code,
+                                headers=dict(response.headers))
+            return response
+        return await call_next(request)
+    response = await call_next(request)
+    if request.method in ("POST", "PUT", "PATCH", "DELETE"):
+        _response_cache.clear()
+    return response
+
+# Registered after the cache middleware so CORS stays outermost (the stack
+# is built last-registered-first) and cache hits still get CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -18,7 +58,12 @@ services_db = {}
 availability_db = {}
 customers_db = {}
 appointments_db = {}
-counter = {"service": 1, "availability": 1, "customer": 1, "appointment": 1}
+booked_slots = {}  # slot_id -> appointment_id for status == "booked"
+reminded_ids = set()  # appointment ids that already got a 24h reminder
+_service_ids = itertools.count(1)
+_slot_ids = itertools.count(1)
+_customer_ids = itertools.count(1)
+_appointment_ids = itertools.count(1)
 
 # Models
 class Service(BaseModel):
@@ -48,93 +93,106 @@ class AppointmentUpdate(BaseModel):
 
 # Endpoints
 @app.get("/api/services")
-def get_services() -> List[dict]:
+async def get_services() -> List[dict]:
     return list(services_db.values())
 
 @app.post("/api/services")
-def create_service(service: Service) -> dict:
-    service_id = counter["service"]
-    service_dict = {"id": service_id, **service.dict()}
+async def create_service(service: Service) -> dict:
+    service_id = next(_service_ids)
+    service_dict = {"id": service_id, **service.model_dump()}
     services_db[service_id] = service_dict
-    counter["service"] += 1
     return service_dict
 
 @app.post("/api/availability")
-def create_availability(slot: AvailabilitySlot) -> dict:
+async def create_availability(slot: AvailabilitySlot) -> dict:
     if slot.service_id not in services_db:
         raise HTTPException(status_code=404, detail="Service not found")
     service_duration = services_db[slot.service_id]["duration_minutes"]
     slot_duration = (slot.end_time - slot.start_time).seconds // 60
     if slot_duration != service_duration:
         raise HTTPException(status_code=400, detail=f"Slot duration must be {service_duration} minutes")
-    slot_id = counter["availability"]
-    slot_dict = {"id": slot_id, **slot.dict()}
+    slot_id = next(_slot_ids)
+    slot_dict = {"id": slot_id, **slot.model_dump()}
     availability_db[slot_id] = slot_dict
-    counter["availability"] += 1
     return slot_dict
 
 @app.get("/api/availability")
-def get_availability(service_id: Optional[int] = None) -> List[dict]:
-    booked_slots = [a["slot_id"] for a in appointments_db.values() if a["status"] == "booked"]
+async def get_availability(service_id: Optional[int] = None) -> List[dict]:
     available = [slot for slot in availability_db.values() if slot["id"] not in booked_slots]
     if service_id:
         available = [slot for slot in available if slot["service_id"] == service_id]
     return available
 
 @app.post("/api/customers")
-def create_customer(customer: Customer) -> dict:
+async def create_customer(customer: Customer) -> dict:
     for cust in customers_db.values():
         if cust["email"] == customer.email:
             return cust
-    customer_id = counter["customer"]
-    customer_dict = {"id": customer_id, **customer.dict()}
+    customer_id = next(_customer_ids)
+    customer_dict = {"id": customer_id, **customer.model_dump()}
     customers_db[customer_id] = customer_dict
-    counter["customer"] += 1
     return customer_dict
 
 @app.post("/api/appointments")
-def create_appointment(appointment: Appointment) -> dict:
+async def create_appointment(appointment: Appointment) -> dict:
     if appointment.slot_id not in availability_db:
         raise HTTPException(status_code=404, detail="Slot not found")
-    for appt in appointments_db.values():
-        if appt["slot_id"] == appointment.slot_id and appt["status"] == "booked":
-            raise HTTPException(status_code=400, detail="Slot already booked")
-    appointment_id = counter["appointment"]
-    appointment_dict = {"id": appointment_id, "created_at": datetime.now(), **appointment.dict()}
+    if appointment.slot_id in booked_slots:
+        raise HTTPException(status_code=400, detail="Slot already booked")
+    appointment_id = next(_appointment_ids)
+    appointment_dict = {"id": appointment_id, "created_at": datetime.now(), **appointment.model_dump()}
     appointments_db[appointment_id] = appointment_dict
+    if appointment_dict["status"] == "booked":
+        booked_slots[appointment_dict["slot_id"]] = appointment_id
     # Booking confirmation (US009)
     if appointment.customer_id in customers_db:
         customer_email = customers_db[appointment.customer_id]["email"]
-        print(f"[EMAIL] Booking confirmation sent to {customer_email} for appointment {appointment_id}")
-    counter["appointment"] += 1
+        logger.info("[EMAIL] Booking confirmation sent to %s for appointment %s", customer_email, appointment_id)
     return appointment_dict
 
-@app.get("/api/appointments")
-def get_appointments() -> List[dict]:
-    # Email reminders (US007)
-    for appt in appointments_db.values():
-        if appt["status"] == "booked":
+async def _reminder_loop():
+    # Email reminders (US007) run off the request path once a minute.
+    while True:
+        now = datetime.now()
+        window_start = now + timedelta(hours=24)
+        window_end = now + timedelta(hours=48)
+        for appt in appointments_db.values():
+            if appt["status"] != "booked" or appt["id"] in reminded_ids:
+                continue
             slot = availability_db.get(appt["slot_id"])
-            if slot:
-                time_until = (slot["start_time"] - datetime.now()).total_seconds() / 3600
-                if 24 <= time_until <= 48:
-                    customer = customers_db.get(appt["customer_id"])
-                    if customer:
-                        print(f"[REMINDER] 24h reminder sent to {customer['email']} for appointment {appt['id']}")
+            if not slot:
+                continue
+            if window_start <= slot["start_time"] <= window_end:
+                customer = customers_db.get(appt["customer_id"])
+                if customer:
+                    logger.info("[REMINDER] 24h reminder sent to %s for appointment %s", customer["email"], appt["id"])
+                    reminded_ids.add(appt["id"])
+        await asyncio.sleep(60)
+
+@app.on_event("startup")
+async def _start_reminder_loop():
+    asyncio.create_task(_reminder_loop())
+
+@app.get("/api/appointments")
+async def get_appointments() -> List[dict]:
     return list(appointments_db.values())
 
 @app.put("/api/appointments/{appointment_id}")
-def update_appointment(appointment_id: int, update: AppointmentUpdate) -> dict:
+async def update_appointment(appointment_id: int, update: AppointmentUpdate) -> dict:
     if appointment_id not in appointments_db:
         raise HTTPException(status_code=404, detail="Appointment not found")
+    appointment = appointments_db[appointment_id]
     if update.slot_id:
         if update.slot_id not in availability_db:
             raise HTTPException(status_code=404, detail="New slot not found")
-        for appt in appointments_db.values():
-            if appt["slot_id"] == update.slot_id and appt["status"] == "booked" and appt["id"] != appointment_id:
-                raise HTTPException(status_code=400, detail="New slot already booked")
+        if booked_slots.get(update.slot_id, appointment_id) != appointment_id:
+            raise HTTPException(status_code=400, detail="New slot already booked")
+    if booked_slots.get(appointment["slot_id"]) == appointment_id:
+        del booked_slots[appointment["slot_id"]]
     if update.status:
-        appointments_db[appointment_id]["status"] = update.status
+        appointment["status"] = update.status
     if update.slot_id:
-        appointments_db[appointment_id]["slot_id"] = update.slot_id
-    return appointments_db[appointment_id]
+        appointment["slot_id"] = update.slot_id
+    if appointment["status"] == "booked":
+        booked_slots[appointment["slot_id"]] = appointment_id
+    return appointment
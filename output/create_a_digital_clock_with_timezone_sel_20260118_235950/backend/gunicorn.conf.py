@@ -0,0 +1,8 @@
+import os
+
+workers = 2 * (os.cpu_count() or 1)
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = "0.0.0.0:8000"
+
+# The *_db dicts in main.py are per-worker: each process keeps its own
+# state until an external store (e.g. Redis) replaces them.
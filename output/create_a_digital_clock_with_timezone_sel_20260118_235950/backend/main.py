@@ -1,11 +1,14 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
-import pytz
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict
+from zoneinfo import ZoneInfo
+import orjson
 import tzlocal
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,13 +24,19 @@ TIMEZONES = [
     {"label": "UTC+8: Beijing", "value": "Asia/Shanghai"},
     {"label": "UTC+9: Tokyo", "value": "Asia/Tokyo"},
 ]
+# TIMEZONES never changes, so serialize it once at import time.
+_TIMEZONES_RESPONSE = Response(content=orjson.dumps(TIMEZONES), media_type="application/json")
 
 user_settings: Dict[str, Dict] = {}
 local_tz = tzlocal.get_localzone_name()
 
+@lru_cache(maxsize=512)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
 def get_current_time(timezone: str, hour_format: str) -> Dict:
     try:
-        tz = pytz.timezone(timezone)
+        tz = _tz(timezone)
         now = datetime.now(tz)
         if hour_format == "12":
             hour = now.strftime("%I")
@@ -46,22 +55,22 @@ def get_current_time(timezone: str, hour_format: str) -> Dict:
         raise HTTPException(status_code=400, detail="Invalid timezone")
 
 @app.get("/api/current-time")
-def get_time(user_id: str = "default", timezone: str = None, hour_format: str = None):
+async def get_time(user_id: str = "default", timezone: str = None, hour_format: str = None):
     settings = user_settings.get(user_id, {"timezone": local_tz, "hour_format": "24"})
     tz = timezone or settings.get("timezone", local_tz)
     fmt = hour_format or settings.get("hour_format", "24")
     return get_current_time(tz, fmt)
 
 @app.get("/api/timezones")
-def list_timezones() -> List[Dict]:
-    return TIMEZONES
+async def list_timezones():
+    return _TIMEZONES_RESPONSE
 
 @app.get("/api/user-settings")
-def get_settings(user_id: str = "default"):
+async def get_settings(user_id: str = "default"):
     return user_settings.get(user_id, {"timezone": local_tz, "hour_format": "24"})
 
 @app.post("/api/user-settings")
-def update_settings(user_id: str = "default", timezone: str = None, hour_format: str = None):
+async def update_settings(user_id: str = "default", timezone: str = None, hour_format: str = None):
     if user_id not in user_settings:
         user_settings[user_id] = {"timezone": local_tz, "hour_format": "24"}
     if timezone:
@@ -1,11 +1,13 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import List, Optional
 import uuid
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -16,6 +18,7 @@ app.add_middleware(
 )
 
 projects = {}
+_VALID_STATUSES = frozenset({"todo", "in_progress", "done"})
 tasks = {}
 users = {"1": {"id": "1", "username": "alice", "email": "alice@example.com"},
          "2": {"id": "2", "username": "bob", "email": "bob@example.com"}}
@@ -35,9 +38,19 @@ class TaskUpdate(BaseModel):
     assignee_id: Optional[str] = None
     deadline: Optional[datetime] = None
 
+@dataclass(slots=True)
+class TaskRow:
+    id: str
+    title: str
+    description: str
+    status: str
+    deadline: Optional[datetime]
+    project_id: str
+    assignee_id: Optional[str]
+
 @app.post("/api/projects")
-def create_project(project: ProjectCreate):
-    project_id = str(uuid.uuid4())
+async def create_project(project: ProjectCreate):
+    project_id = uuid.uuid4().hex
     projects[project_id] = {
         "id": project_id,
         "name": project.name,
@@ -47,71 +60,74 @@ def create_project(project: ProjectCreate):
     return projects[project_id]
 
 @app.get("/api/projects")
-def get_projects():
+async def get_projects():
     return list(projects.values())
 
 @app.post("/api/projects/{project_id}/tasks")
-def add_task(project_id: str, task: TaskCreate):
+async def add_task(project_id: str, task: TaskCreate):
     if project_id not in projects:
         raise HTTPException(status_code=404, detail="Project not found")
-    task_id = str(uuid.uuid4())
-    tasks[task_id] = {
-        "id": task_id,
-        "title": task.title,
-        "description": task.description,
-        "status": "todo",
-        "deadline": task.deadline,
-        "project_id": project_id,
-        "assignee_id": task.assignee_id
-    }
+    task_id = uuid.uuid4().hex
+    tasks[task_id] = TaskRow(
+        id=task_id,
+        title=task.title,
+        description=task.description,
+        status="todo",
+        deadline=task.deadline,
+        project_id=project_id,
+        assignee_id=task.assignee_id,
+    )
     return tasks[task_id]
 
 @app.put("/api/tasks/{task_id}")
-def update_task(task_id: str, updates: TaskUpdate):
+async def update_task(task_id: str, updates: TaskUpdate):
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
+    task = tasks[task_id]
     if updates.status:
-        if updates.status not in ["todo", "in_progress", "done"]:
+        if updates.status not in _VALID_STATUSES:
             raise HTTPException(status_code=400, detail="Invalid status")
-        tasks[task_id]["status"] = updates.status
+        task.status = updates.status
     if updates.assignee_id is not None:
-        tasks[task_id]["assignee_id"] = updates.assignee_id
+        task.assignee_id = updates.assignee_id
     if updates.deadline is not None:
-        tasks[task_id]["deadline"] = updates.deadline
-    return tasks[task_id]
+        task.deadline = updates.deadline
+    return task
 
 @app.get("/api/tasks")
-def get_tasks(assignee_id: Optional[str] = None, project_id: Optional[str] = None):
-    filtered_tasks = list(tasks.values())
-    if assignee_id:
-        filtered_tasks = [t for t in filtered_tasks if t["assignee_id"] == assignee_id]
-    if project_id:
-        filtered_tasks = [t for t in filtered_tasks if t["project_id"] == project_id]
-    for task in filtered_tasks:
-        if task["deadline"] and task["deadline"] < datetime.now() and task["status"] != "done":
-            task["overdue"] = True
-        else:
-            task["overdue"] = False
-    return filtered_tasks
+async def get_tasks(assignee_id: Optional[str] = None, project_id: Optional[str] = None):
+    now = datetime.now()
+    # Tag overdue on response copies; the stored task dicts stay clean.
+    return [
+        {**asdict(t), "overdue": bool(t.deadline and t.deadline < now and t.status != "done")}
+        for t in tasks.values()
+        if (not assignee_id or t.assignee_id == assignee_id)
+        and (not project_id or t.project_id == project_id)
+    ]
 
 @app.get("/api/projects/{project_id}/tasks")
-def get_project_tasks(project_id: str):
+async def get_project_tasks(project_id: str):
     if project_id not in projects:
         raise HTTPException(status_code=404, detail="Project not found")
-    project_tasks = [t for t in tasks.values() if t["project_id"] == project_id]
-    done_count = sum(1 for t in project_tasks if t["status"] == "done")
+    project_tasks = [t for t in tasks.values() if t.project_id == project_id]
+    done_count = sum(1 for t in project_tasks if t.status == "done")
     total = len(project_tasks)
     progress = (done_count / total * 100) if total > 0 else 0.0
     projects[project_id]["progress_percentage"] = progress
     return project_tasks
 
 @app.delete("/api/tasks/{task_id}")
-def delete_task(task_id: str):
+async def delete_task(task_id: str):
     if task_id not in tasks:
         raise HTTPException(status_code=404, detail="Task not found")
     del tasks[task_id]
     return {"message": "Task deleted"}
 
 @app.get("/api/users")
-def get_users():
-    return list(users.values())
\ No newline at end of file
+async def get_users():
+    return list(users.values())
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", loop="uvloop", http="httptools", log_level="warning")
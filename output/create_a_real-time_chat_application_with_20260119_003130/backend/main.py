@@ -1,14 +1,26 @@
-from fastapi import FastAPI, HTTPException, WebSocket, UploadFile, File
+import asyncio
+import hashlib
+import hmac
+from collections import defaultdict
+from pathlib import Path
+
+import aiofiles
+import anyio.to_thread
+
+from fastapi import FastAPI, HTTPException, Request, WebSocket, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import time
 import uuid
-import hashlib
-import json
 import jwt
+import orjson
+from cachetools import TTLCache
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,11 +31,18 @@ app.add_middleware(
 )
 
 SECRET_KEY = "chat-secret-key"
+UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR.mkdir(exist_ok=True)
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+# OWASP-recommended Argon2id parameters: ~50ms per hash on the server,
+# memory-hard against GPU cracking.
+ph = PasswordHasher(time_cost=3, memory_cost=46 * 1024, parallelism=1)
 users_db = {}
 rooms_db = {}
 messages_db = []
-active_connections = []
-unread_counts = {}
+messages_by_room = defaultdict(list)  # room_id -> messages, in arrival order
+active_connections = {}  # username -> WebSocket
+unread_counts = {}  # room_id -> {username: count}
 
 class UserRegister(BaseModel):
     username: str
@@ -37,85 +56,138 @@ class UserLogin(BaseModel):
 class ChatRoomCreate(BaseModel):
     name: str
 
-def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
-
 def create_jwt(username: str) -> str:
     return jwt.encode({"sub": username, "exp": time.time() + 3600}, SECRET_KEY, algorithm="HS256")
 
+# Short-lived cache of successful verifies so reconnect storms don't pay
+# the ~50ms Argon2 cost per attempt. Only positive outcomes are stored:
+# a digest of the password per username, compared in constant time so
+# the shortcut leaks no timing signal about the cached digest.
+_login_cache = TTLCache(maxsize=1024, ttl=5)
+
+async def _broadcast(payload: str, skip: str = None):
+    # Structured fan-out with a per-send timeout so one laggy client can't
+    # stall the whole broadcast; timed-out or dead sockets are evicted.
+    stale = []
+
+    async def _send(uname: str, ws: WebSocket):
+        try:
+            await asyncio.wait_for(ws.send_text(payload), timeout=0.5)
+        except Exception:  # timeout or closed/broken socket
+            stale.append(uname)
+
+    async with asyncio.TaskGroup() as tg:
+        for uname, ws in list(active_connections.items()):
+            if uname != skip:
+                tg.create_task(_send(uname, ws))
+    for uname in stale:
+        active_connections.pop(uname, None)
+        if uname in users_db:
+            users_db[uname]["status"] = "offline"
+
 @app.websocket("/ws/{username}")
 async def websocket_endpoint(websocket: WebSocket, username: str):
     await websocket.accept()
-    active_connections.append({"username": username, "websocket": websocket})
+    active_connections[username] = websocket
     users_db[username]["status"] = "online"
     try:
         while True:
             data = await websocket.receive_text()
-            msg_data = json.loads(data)
+            msg_data = orjson.loads(data)
             if msg_data.get("type") == "typing":
-                for conn in active_connections:
-                    if conn["username"] != username:
-                        await conn["websocket"].send_text(json.dumps({"type": "typing", "user": username}))
+                payload = orjson.dumps({"type": "typing", "user": username}).decode()
+                await _broadcast(payload, skip=username)
             elif msg_data.get("type") == "message":
                 room_id = msg_data["room_id"]
                 msg = {"id": len(messages_db), "room_id": room_id, "user_id": username, "content": msg_data["content"], "created_at": time.time()}
                 messages_db.append(msg)
-                for conn in active_connections:
-                    if conn["username"] != username:
-                        unread_counts[(conn["username"], room_id)] = unread_counts.get((conn["username"], room_id), 0) + 1
-                    await conn["websocket"].send_text(json.dumps({"type": "new_message", "message": msg}))
+                messages_by_room[room_id].append(msg)
+                room_counts = unread_counts.setdefault(room_id, {})
+                for uname in active_connections:
+                    if uname != username:
+                        room_counts[uname] = room_counts.get(uname, 0) + 1
+                payload = orjson.dumps({"type": "new_message", "message": msg}).decode()
+                await _broadcast(payload)
     except:
         pass
     finally:
-        active_connections[:] = [c for c in active_connections if c["username"] != username]
+        active_connections.pop(username, None)
         users_db[username]["status"] = "offline"
 
+@app.on_event("startup")
+async def _raise_thread_limit():
+    # Argon2 verify is ~50ms of CPU; widen the default 40-token threadpool
+    # so hashing bursts do not starve other offloaded work.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
+def _verify_password(stored_hash: str, password: str) -> bool:
+    try:
+        ph.verify(stored_hash, password)
+        return True
+    except VerifyMismatchError:
+        return False
+
 @app.post("/api/auth/register")
-def register(user: UserRegister):
+async def register(user: UserRegister):
     if user.username in users_db:
         raise HTTPException(status_code=400, detail="Username exists")
-    users_db[user.username] = {"email": user.email, "password_hash": hash_password(user.password), "status": "offline"}
+    password_hash = await anyio.to_thread.run_sync(ph.hash, user.password)
+    users_db[user.username] = {"email": user.email, "password_hash": password_hash, "status": "offline"}
     return {"message": "User registered"}
 
 @app.post("/api/auth/login")
-def login(user: UserLogin):
+async def login(user: UserLogin):
     if user.username not in users_db:
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    if hash_password(user.password) != users_db[user.username]["password_hash"]:
-        raise HTTPException(status_code=401, detail="Invalid credentials")
+    digest = hashlib.blake2b(user.password.encode(), digest_size=16).digest()
+    cached = _login_cache.get(user.username)
+    if cached is None or not hmac.compare_digest(cached, digest):
+        valid = await anyio.to_thread.run_sync(_verify_password, users_db[user.username]["password_hash"], user.password)
+        if not valid:
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        _login_cache[user.username] = digest
     users_db[user.username]["status"] = "online"
     token = create_jwt(user.username)
     return {"message": "Login successful", "token": token, "user": user.username}
 
 @app.post("/api/rooms")
-def create_room(room: ChatRoomCreate):
-    room_id = str(uuid.uuid4())
+async def create_room(room: ChatRoomCreate):
+    room_id = uuid.uuid4().hex
     rooms_db[room_id] = {"name": room.name, "created_at": time.time()}
     return {"room_id": room_id, "message": "Room created"}
 
 @app.get("/api/rooms")
-def list_rooms():
+async def list_rooms():
     return [{"id": k, **v} for k, v in rooms_db.items()]
 
 @app.post("/api/rooms/{room_id}/join")
-def join_room(room_id: str):
+async def join_room(room_id: str):
     if room_id not in rooms_db:
         raise HTTPException(status_code=404, detail="Room not found")
     return {"message": f"Joined room {room_id}"}
 
 @app.get("/api/rooms/{room_id}/messages")
-def get_messages(room_id: str):
+async def get_messages(room_id: str):
     if room_id not in rooms_db:
         raise HTTPException(status_code=404, detail="Room not found")
-    room_msgs = [m for m in messages_db if m["room_id"] == room_id]
-    return room_msgs
+    return messages_by_room.get(room_id, [])
 
 @app.post("/api/upload")
-async def upload_file(file: UploadFile = File(...)):
-    await file.read()
-    file_url = f"/uploads/{uuid.uuid4()}_{file.filename}"
-    return {"file_url": file_url, "message": "File uploaded"}
+async def upload_file(request: Request, file: UploadFile = File(...)):
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+    dest = UPLOAD_DIR / f"{uuid.uuid4().hex}_{file.filename}"
+    async with aiofiles.open(dest, "wb") as out:
+        while chunk := await file.read(1 << 20):
+            await out.write(chunk)
+    return {"file_url": f"/uploads/{dest.name}", "message": "File uploaded"}
 
 @app.get("/api/users/status")
-def get_user_status():
-    return [{"username": k, "status": v["status"]} for k, v in users_db.items()]
\ No newline at end of file
+async def get_user_status():
+    return [{"username": k, "status": v["status"]} for k, v in users_db.items()]
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", loop="uvloop", http="httptools", log_level="warning")
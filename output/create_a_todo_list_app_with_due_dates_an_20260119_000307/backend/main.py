@@ -1,11 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 from typing import Optional, List
 import uuid
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,6 +16,7 @@ app.add_middleware(
 )
 
 tasks_db = {}
+_VALID_PRIORITIES = frozenset({"high", "medium", "low"})
 
 class TaskCreate(BaseModel):
     title: str
@@ -31,20 +33,23 @@ class Task(TaskCreate):
     is_complete: bool = False
     created_at: datetime
 
+_task_list_adapter = TypeAdapter(List[Task])
+_NO_DUE_DATE = datetime.max  # sorts tasks without a due date last
+
 @app.get("/api/tasks")
-def get_tasks(priority: Optional[str] = None, sort: Optional[str] = None):
+async def get_tasks(priority: Optional[str] = None, sort: Optional[str] = None):
     tasks = list(tasks_db.values())
-    if priority and priority in ["high", "medium", "low"]:
+    if priority and priority in _VALID_PRIORITIES:
         tasks = [t for t in tasks if t.priority == priority]
     if sort == "due_date":
-        tasks.sort(key=lambda x: (x.due_date is None, x.due_date))
-    return tasks
+        tasks.sort(key=lambda x: x.due_date or _NO_DUE_DATE)
+    return Response(content=_task_list_adapter.dump_json(tasks), media_type="application/json")
 
 @app.post("/api/tasks")
-def create_task(task: TaskCreate):
-    if task.priority not in ["high", "medium", "low"]:
+async def create_task(task: TaskCreate):
+    if task.priority not in _VALID_PRIORITIES:
         raise HTTPException(status_code=400, detail="Priority must be high, medium, or low")
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     new_task = Task(
         id=task_id,
         title=task.title,
@@ -56,7 +61,7 @@ def create_task(task: TaskCreate):
     return new_task
 
 @app.put("/api/tasks/{task_id}")
-def update_task(task_id: str, task_update: TaskUpdate):
+async def update_task(task_id: str, task_update: TaskUpdate):
     if task_id not in tasks_db:
         raise HTTPException(status_code=404, detail="Task not found")
     task = tasks_db[task_id]
@@ -65,21 +70,26 @@ def update_task(task_id: str, task_update: TaskUpdate):
     if task_update.due_date is not None:
         task.due_date = task_update.due_date
     if task_update.priority is not None:
-        if task_update.priority not in ["high", "medium", "low"]:
+        if task_update.priority not in _VALID_PRIORITIES:
             raise HTTPException(status_code=400, detail="Priority must be high, medium, or low")
         task.priority = task_update.priority
     return task
 
 @app.patch("/api/tasks/{task_id}/complete")
-def mark_complete(task_id: str):
+async def mark_complete(task_id: str):
     if task_id not in tasks_db:
         raise HTTPException(status_code=404, detail="Task not found")
     tasks_db[task_id].is_complete = True
     return tasks_db[task_id]
 
 @app.delete("/api/tasks/{task_id}")
-def delete_task(task_id: str):
+async def delete_task(task_id: str):
     if task_id not in tasks_db:
         raise HTTPException(status_code=404, detail="Task not found")
     del tasks_db[task_id]
     return {"message": "Task deleted"}
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("main:app", loop="uvloop", http="httptools", log_level="warning")
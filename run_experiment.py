@@ -4,20 +4,23 @@ Run experiments with enhanced error handling
 """
 
 import sys
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 from src.crew import PentagonCrew, BaselineCrew
 
 
-def load_prompts(filepath: str = "data/prompts/vibe_prompts.json") -> list:
-    """Load vibe prompts from JSON file."""
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-        prompts = data.get("prompts", [])
+@lru_cache(maxsize=4)
+def _load_prompts(filepath: str, mtime_ns: int) -> list:
+    return orjson.loads(Path(filepath).read_bytes()).get("prompts", [])
+
 
-    return prompts
+def load_prompts(filepath: str = "data/prompts/vibe_prompts.json") -> list:
+    """Load vibe prompts from JSON file, cached until the file changes."""
+    return _load_prompts(filepath, Path(filepath).stat().st_mtime_ns)
 
 
 def run_single_test(prompt: str = "Build a simple calculator"):
@@ -50,15 +53,16 @@ def run_comparison(prompt: str):
     print(f"Prompt: {prompt}")
     print("="*60)
     
-    # Pentagon
-    print("\n--- Running Pentagon Protocol ---")
+    # Pentagon and Baseline are independent API-bound workloads, so run
+    # them in parallel; wall clock drops from the sum to the max of the two.
+    print("\n--- Running Pentagon and Baseline in parallel ---")
     pentagon = PentagonCrew(verbose=True)
-    pentagon_result = pentagon.run(prompt)
-    
-    # Baseline
-    print("\n--- Running Baseline (Single Agent) ---")
     baseline = BaselineCrew(verbose=True)
-    baseline_result = baseline.run(prompt)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pentagon_future = pool.submit(pentagon.run, prompt)
+        baseline_future = pool.submit(baseline.run, prompt)
+        pentagon_result = pentagon_future.result()
+        baseline_result = baseline_future.result()
     
     # Summary
     print("\n" + "="*60)
@@ -83,42 +87,46 @@ def run_full_experiment():
     print(f"Total Prompts: {len(prompts)}")
     print("="*60)
     
-    results = []
-    for i, prompt_data in enumerate(prompts):
-        prompt_id = prompt_data.get("id", f"VP{i+1:02d}")
-        prompt_text = prompt_data.get("prompt", "")
-        complexity = prompt_data.get("complexity", "unknown")
-        expected_features = prompt_data.get("expected_features", [])
-            
-        print(f"\n{'='*60}")
-        print(f"[{i+1}/{len(prompts)}] {prompt_id} ({complexity})")
-        print(f"Prompt: {prompt_text[:60]}...")
-        print("="*60)
-
-        comparison = run_comparison(f"{prompt_text}, which sould have minimum features : {', '.join(expected_features)}")
-        comparison["prompt_id"] = prompt_id
-        comparison["complexity"] = complexity
-        comparison["expected_features"] = expected_features
-        results.append(comparison)
-    
-    # Save results
+    # Stream each comparison to NDJSON as it completes: memory stays flat
+    # regardless of prompt count and a crash mid-run keeps all prior results.
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_file = Path("output") / f"full_experiment_{timestamp}.json"
+    results_file = Path("output") / f"full_experiment_{timestamp}.ndjson"
     results_file.parent.mkdir(exist_ok=True)
-    
-    with open(results_file, 'w') as f:
-        json.dump({
-            "experiment_date": datetime.now().isoformat(),
-            "total_prompts": len(prompts),
-            "results": results
-        }, f, indent=2, default=str)
-    
+
+    pentagon_success = 0
+    baseline_success = 0
+    results = []
+    with open(results_file, 'wb') as f:
+        for i, prompt_data in enumerate(prompts):
+            prompt_id = prompt_data.get("id", f"VP{i+1:02d}")
+            prompt_text = prompt_data.get("prompt", "")
+            complexity = prompt_data.get("complexity", "unknown")
+            expected_features = prompt_data.get("expected_features", [])
+
+            print(f"\n{'='*60}")
+            print(f"[{i+1}/{len(prompts)}] {prompt_id} ({complexity})")
+            print(f"Prompt: {prompt_text[:60]}...")
+            print("="*60)
+
+            comparison = run_comparison(f"{prompt_text}, which sould have minimum features : {', '.join(expected_features)}")
+            comparison["prompt_id"] = prompt_id
+            comparison["complexity"] = complexity
+            comparison["expected_features"] = expected_features
+
+            f.write(orjson.dumps(comparison, default=str) + b"\n")
+            f.flush()
+
+            pentagon_success += 1 if comparison["pentagon"]["success"] else 0
+            baseline_success += 1 if comparison["baseline"]["success"] else 0
+            results.append({
+                "prompt_id": prompt_id,
+                "complexity": complexity,
+                "pentagon_success": comparison["pentagon"]["success"],
+                "baseline_success": comparison["baseline"]["success"],
+            })
+
     print(f"\nResults saved to: {results_file}")
     
-    # Summary
-    pentagon_success = sum(1 for r in results if r["pentagon"]["success"])
-    baseline_success = sum(1 for r in results if r["baseline"]["success"])
-    
     print("\n" + "="*60)
     print("EXPERIMENT SUMMARY")
     print("="*60)
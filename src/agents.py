@@ -3,6 +3,7 @@ Pentagon Protocol - Enhanced Agent Definitions
 With better prompts and deterministic configuration
 """
 
+import functools
 import os
 from dotenv import load_dotenv
 from crewai import Agent, LLM
@@ -10,8 +11,9 @@ from crewai import Agent, LLM
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=1)
 def get_llm() -> LLM:
-    """Get deterministic DeepSeek LLM configuration."""
+    """Get the shared deterministic DeepSeek LLM configuration."""
     return LLM(
         model="deepseek/deepseek-chat",
         base_url=os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com"),
@@ -4,13 +4,32 @@ With robust error handling, output saving, iterative QA feedback loop,
 memory-efficient context management, manager coordination, and truncation recovery
 """
 
+import asyncio
 import gc
+import hashlib
+import io
 import json
+import os
+import re
+import sys
+import textwrap
 import time
+from collections import Counter
+from dataclasses import asdict, dataclass, is_dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional, List, Set
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - listed in requirements.txt
+    orjson = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
 from crewai import Crew, Process, Agent, Task
 
 from .agents import (
@@ -44,6 +63,140 @@ AGENT_DEPENDENCIES = {
     AGENT_FRONTEND_ENGINEER: [],
 }
 
+# Execution order for the buildable agents; a tuple so it can never be
+# mutated per run and membership/iteration stay allocation-free.
+EXECUTION_ORDER = (
+    AGENT_PRODUCT_OWNER,
+    AGENT_ARCHITECT,
+    AGENT_BACKEND_ENGINEER,
+    AGENT_FRONTEND_ENGINEER,
+)
+
+
+def _downstream_closure(agent: str) -> frozenset:
+    """Transitive closure of AGENT_DEPENDENCIES for one agent."""
+    closure: Set[str] = set()
+    stack = list(AGENT_DEPENDENCIES.get(agent, []))
+    while stack:
+        downstream = stack.pop()
+        if downstream not in closure:
+            closure.add(downstream)
+            stack.extend(AGENT_DEPENDENCIES.get(downstream, []))
+    return frozenset(closure)
+
+
+# Precomputed at import time so dependency expansion is one flat set union
+# per agent instead of re-walking the graph every iteration.
+AGENT_DOWNSTREAM_CLOSURE = {agent: _downstream_closure(agent) for agent in AGENT_DEPENDENCIES}
+
+# Canonical rank for per-agent sections in rendered reports, so repeated
+# renders of equivalent reports produce byte-identical prompt text.
+_AGENT_CANONICAL_ORDER = {
+    name: index
+    for index, name in enumerate(EXECUTION_ORDER + (AGENT_QA_ENGINEER, AGENT_MANAGER))
+}
+
+
+# Route decorators in generated FastAPI code, found in one C-level scan of
+# the file content instead of splitting and stripping every line.
+_ROUTE_DECORATOR_RE = re.compile(r"^[ \t]*(@(?:app|router)\.[^\n]*)", re.MULTILINE)
+
+def _to_jsonable(obj: Any) -> Any:
+    """Normalize values orjson cannot serialize natively.
+
+    Paths become strings, sets become sorted lists, dataclasses and
+    pydantic models are dumped to dicts, recursively. Scalars (including
+    datetimes, which orjson handles in C) pass through untouched.
+    """
+    if isinstance(obj, dict):
+        return {k if isinstance(k, str) else str(k): _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_jsonable(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(str(v) for v in obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _to_jsonable(asdict(obj))
+    if hasattr(obj, 'model_dump'):
+        return _to_jsonable(obj.model_dump())
+    return obj
+
+
+# Characters replaced with '_' in generated project directory names.
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9 _-]")
+
+# Separator between a task's base description and the injected context.
+_CTX_SEP = "\n\n--- CONTEXT ---\n"
+
+# Literal \n / \t escapes left in generated file content; one regex pass
+# replaces both instead of two full-string .replace() copies.
+_UNESCAPE_RE = re.compile(r"\\[nt]")
+_UNESCAPE_MAP = {"\\n": "\n", "\\t": "\t"}
+
+# Failure spellings seen in raw reports; membership checks against this set
+# avoid a per-test-case .lower() allocation on paths that can receive
+# reports which did not pass through update_test_report's normalization.
+_FAIL_STATUSES = frozenset({"fail", "Fail", "FAIL"})
+
+# Placeholder strings returned by formatters when a phase has no data yet;
+# appending them to a prompt only wastes tokens.
+_EMPTY_SECTIONS = frozenset({
+    "No user stories available.",
+    "No system design available.",
+    "No backend endpoints available.",
+    "No backend code available.",
+    "No frontend code available.",
+    "No test report available.",
+})
+
+# README skeleton, dedented once at import; _create_readme only fills the
+# per-project fields instead of rebuilding the whole document as an f-string.
+_README_TMPL = textwrap.dedent("""\
+    # Generated Project
+
+    ## Original Vibe Prompt
+    {vibe_prompt}
+
+    ## Generated: {generated_at}
+
+    ## Project Structure
+    ```
+    {project_name}/
+    ├── backend/          # Python FastAPI backend
+    ├── frontend/         # HTML/CSS/JS frontend
+    ├── phases/           # Intermediate outputs
+    └── README.md
+    ```
+
+    ## How to Run
+
+    ### Backend
+    ```bash
+    cd backend
+    pip install fastapi uvicorn
+    uvicorn main:app --reload --port 8000
+    ```
+
+    ### Frontend
+    ```bash
+    cd frontend
+    # Open index.html in a browser
+    # Or use a simple server:
+    python -m http.server 3000
+    ```
+
+    ## Test Results
+    - Overall Status: {overall_status}
+    - QA Iterations: {qa_iterations}
+    - Success: {success}
+
+    ## Errors
+    {errors_joined}
+
+    Generated by Pentagon Protocol - Schema-Guided Vibe Coding Framework
+    """)
+
 
 class ManagerDecision:
     """Represents the manager's decision about which agents need to re-run."""
@@ -55,6 +208,22 @@ class ManagerDecision:
         self.iteration_goal: str = ""
 
 
+@dataclass(slots=True)
+class _MgrRecord:
+    """Slim per-iteration record of a manager decision.
+
+    Kept in results["manager_decisions"] for the whole run; slots avoid a
+    per-record __dict__ and the free-text fields are truncated at ingest.
+    orjson serializes dataclasses natively, and _to_jsonable converts them
+    for the stdlib json fallback.
+    """
+    iteration: int
+    should_continue: bool
+    agents_to_rerun: tuple
+    reasoning: str
+    iteration_goal: str
+
+
 class ContextManager:
     """
     Manages context data for agents with memory-efficient subset extraction.
@@ -63,46 +232,158 @@ class ContextManager:
     
     def __init__(self):
         self.vibe_prompt: str = ""
+        # Set by PentagonCrew.run; enables spilling code contents to disk.
+        self.project_dir: Optional[Path] = None
         self.user_stories: Optional[Dict] = None
         self.system_design: Optional[Dict] = None
         self.backend_code: Optional[Dict] = None
         self.frontend_code: Optional[Dict] = None
         self.test_report: Optional[Dict] = None
-    
+        self._static_prefix_cache: Dict = {}
+        # Rendered-formatter cache; entries are invalidated by the
+        # update_* setter that owns the underlying data.
+        self._fmt_cache: Dict[str, str] = {}
+        self._test_report_aggregate = None
+        # Content hashes from the previous QA render, used to elide
+        # unchanged files from re-test prompts.
+        self._last_qa_hashes: Dict[str, str] = {}
+        # Failed test cases bucketed by responsible agent, built once per
+        # stored report so per-agent feedback needs no rescans.
+        self._qa_failed_by_agent: Dict[str, List[Dict]] = {}
+        # Comma-joined filenames, rebuilt when code outputs change.
+        self._backend_file_list: str = ""
+        self._frontend_file_list: str = ""
+
+    def _invalidate_fmt(self, *prefixes: str):
+        """Drop cached formatter output whose key starts with any prefix."""
+        for key in list(self._fmt_cache):
+            if key.startswith(prefixes):
+                del self._fmt_cache[key]
+
     def update_user_stories(self, data: Dict):
         """Store user stories data."""
         if data and data.get("success"):
             self.user_stories = data.get("data")
-    
+            self._invalidate_fmt("user_stories_summary", "context:")
+
     def update_system_design(self, data: Dict):
         """Store system design data."""
         if data and data.get("success"):
             self.system_design = data.get("data")
-    
+            self._invalidate_fmt("system_design_summary", "context:")
+
+    @staticmethod
+    def _join_filenames(code_output: Optional[Dict]) -> str:
+        """Comma-join the filenames of a code output."""
+        if not code_output:
+            return ""
+        return ", ".join(
+            f.get("filename", "") for f in code_output.get("files", []) if isinstance(f, dict)
+        )
+
     def update_backend_code(self, data: Dict):
         """Store backend code data."""
         if data and data.get("success"):
-            self.backend_code = data.get("data")
-    
+            self.backend_code = self._spill_code_files(data.get("data"), "backend")
+            self._backend_file_list = self._join_filenames(self.backend_code)
+            self._invalidate_fmt("backend_endpoints_summary", "context:")
+
     def update_frontend_code(self, data: Dict):
         """Store frontend code data."""
         if data and data.get("success"):
-            self.frontend_code = data.get("data")
-    
+            self.frontend_code = self._spill_code_files(data.get("data"), "frontend")
+            self._frontend_file_list = self._join_filenames(self.frontend_code)
+            self._invalidate_fmt("context:")
+
+    def _spill_code_files(self, code_output: Dict, subfolder: str) -> Dict:
+        """Write code contents to disk and keep a slim in-memory copy.
+
+        Generated code dominates the ContextManager's footprint but is
+        only needed when a prompt is actually built. Each file's content
+        is written under the project's phases/context_cache directory and
+        replaced by {filename, description, path, hash}; formatters read
+        the content back lazily via _file_content. Without a project_dir
+        the original dict is kept as-is.
+        """
+        if not self.project_dir or not isinstance(code_output, dict):
+            return code_output
+
+        spill_dir = self.project_dir / "phases" / "context_cache" / subfolder
+        spill_dir.mkdir(parents=True, exist_ok=True)
+
+        slim_files = []
+        for index, file_info in enumerate(code_output.get("files", [])):
+            if not isinstance(file_info, dict):
+                continue
+            filename = file_info.get("filename", f"file_{index}")
+            content = str(file_info.get("content", ""))
+            path = spill_dir / f"{index:02d}_{Path(filename).name}"
+            path.write_text(content, encoding='utf-8')
+            slim_files.append({
+                "filename": filename,
+                "description": file_info.get("description", ""),
+                "path": path,
+                "hash": hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest(),
+            })
+
+        slim = dict(code_output)
+        slim["files"] = slim_files
+        return slim
+
+    @staticmethod
+    def _file_content(file_info: Dict) -> str:
+        """Return a file's content, reading spilled files back from disk."""
+        content = file_info.get("content")
+        if content is not None:
+            return content if isinstance(content, str) else str(content)
+
+        path = file_info.get("path")
+        if path is not None:
+            try:
+                return Path(path).read_text(encoding='utf-8')
+            except OSError:
+                return ""
+        return ""
+
     def update_test_report(self, data: Dict):
         """Store test report data."""
         if data and data.get("success"):
             self.test_report = data.get("data")
+            self._test_report_aggregate = None
+            self._invalidate_fmt("test_report_summary", "qa_feedback:", "context:")
+
+            # Normalize statuses once at ingest so every later consumer
+            # compares directly instead of allocating lowercase copies.
+            overall_status = self.test_report.get("overall_status")
+            if isinstance(overall_status, str):
+                self.test_report["overall_status"] = overall_status.lower()
+
+            failed_by_agent: Dict[str, List[Dict]] = {}
+            for tc in self.test_report.get("test_cases", []):
+                if not isinstance(tc, dict):
+                    continue
+                status = tc.get("status", "")
+                if isinstance(status, str):
+                    tc["status"] = status = status.lower()
+                if status == "fail":
+                    failed_by_agent.setdefault(tc.get("responsible_agent", ""), []).append(tc)
+            self._qa_failed_by_agent = failed_by_agent
     
     def _format_user_stories_summary(self) -> str:
         """Format user stories as a concise summary."""
         if not self.user_stories:
             return "No user stories available."
-        
+
+        cached = self._fmt_cache.get("user_stories_summary")
+        if cached is not None:
+            return cached
+
         stories = self.user_stories.get("stories", [])
         summary_parts = ["## User Stories:"]
-        
-        for story in stories:
+
+        # Deterministic order keeps the rendered block byte-stable across
+        # calls, which is what makes the static prefix cacheable.
+        for story in sorted(stories, key=lambda s: str(s.get("id", ""))):
             story_id = story.get("id", "N/A")
             title = story.get("title", "N/A")
             description = story.get("description", "N/A")
@@ -111,21 +392,27 @@ class ContextManager:
         
         if self.user_stories.get("summary"):
             summary_parts.append(f"\nSummary: {self.user_stories.get('summary')}")
-        
-        return "\n".join(summary_parts)
+
+        summary = "\n".join(summary_parts)
+        self._fmt_cache["user_stories_summary"] = summary
+        return summary
     
     def _format_system_design_summary(self) -> str:
         """Format system design as a concise summary."""
         if not self.system_design:
             return "No system design available."
-        
+
+        cached = self._fmt_cache.get("system_design_summary")
+        if cached is not None:
+            return cached
+
         summary_parts = ["## System Design:"]
         
         # Models
         models = self.system_design.get("models", [])
         if models:
             summary_parts.append("\n### Data Models:")
-            for model in models:
+            for model in sorted(models, key=lambda m: str(m.get("name", ""))):
                 name = model.get("name", "N/A")
                 fields = model.get("fields", [])
                 fields_str = ", ".join(fields) if fields else "no fields"
@@ -135,7 +422,10 @@ class ContextManager:
         endpoints = self.system_design.get("endpoints", [])
         if endpoints:
             summary_parts.append("\n### API Endpoints:")
-            for endpoint in endpoints:
+            for endpoint in sorted(
+                endpoints,
+                key=lambda e: (str(e.get("method", "GET")), str(e.get("path", "/")))
+            ):
                 method = endpoint.get("method", "GET")
                 path = endpoint.get("path", "/")
                 description = endpoint.get("description", "")
@@ -143,14 +433,20 @@ class ContextManager:
         
         if self.system_design.get("architecture_notes"):
             summary_parts.append(f"\nNotes: {self.system_design.get('architecture_notes')}")
-        
-        return "\n".join(summary_parts)
+
+        summary = "\n".join(summary_parts)
+        self._fmt_cache["system_design_summary"] = summary
+        return summary
     
     def _format_backend_endpoints_summary(self) -> str:
         """Format only backend endpoints (not full code) for frontend context."""
         if not self.backend_code:
             return "No backend endpoints available."
-        
+
+        cached = self._fmt_cache.get("backend_endpoints_summary")
+        if cached is not None:
+            return cached
+
         summary_parts = ["## Backend API Endpoints:"]
         
         files = self.backend_code.get("files", [])
@@ -158,12 +454,9 @@ class ContextManager:
         for file_info in files:
             filename = file_info.get("filename", "")
             if "main" in filename.lower() or "route" in filename.lower():
-                content = file_info.get("content", "")
-                lines = content.split("\n") if isinstance(content, str) else []
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("@app.") or line.startswith("@router."):
-                        summary_parts.append(f"- {line}")
+                content = self._file_content(file_info)
+                for match in _ROUTE_DECORATOR_RE.finditer(content):
+                    summary_parts.append(f"- {match.group(1).rstrip()}")
         
         setup = self.backend_code.get("setup_instructions", "")
         if setup:
@@ -175,62 +468,77 @@ class ContextManager:
                 filename = file_info.get("filename", "")
                 description = file_info.get("description", "")
                 summary_parts.append(f"- {filename}: {description}")
-        
-        return "\n".join(summary_parts)
+
+        summary = "\n".join(summary_parts)
+        self._fmt_cache["backend_endpoints_summary"] = summary
+        return summary
     
-    def _format_backend_code_full(self) -> str:
-        """Format full backend code for QA context."""
-        if not self.backend_code:
-            return "No backend code available."
-        
-        summary_parts = ["## Backend Code:"]
-        
-        files = self.backend_code.get("files", [])
+    def _format_code_full(self, code_output: Dict, heading: str, hash_prefix: str) -> str:
+        """Format code files for QA context, eliding unchanged files.
+
+        Files whose content hash matches the previous QA render are
+        replaced by an [unchanged] marker, so re-test prompts only carry
+        the code that actually changed since the last iteration.
+        """
+        # Incremental buffer writes avoid materialising a list of large
+        # code fragments plus the final join copy.
+        buf = io.StringIO()
+        buf.write(heading)
+
+        files = code_output.get("files", [])
         for file_info in files:
             filename = file_info.get("filename", "")
-            content = file_info.get("content", "")
             description = file_info.get("description", "")
-            
-            summary_parts.append(f"\n### {filename}")
+
+            # Spilled entries carry a precomputed hash, so unchanged files
+            # are skipped without reading them back from disk.
+            digest = file_info.get("hash")
+            if digest is None:
+                digest = hashlib.blake2b(
+                    self._file_content(file_info).encode("utf-8"), digest_size=8
+                ).hexdigest()
+            hash_key = f"{hash_prefix}:{filename}"
+
+            if self._last_qa_hashes.get(hash_key) == digest:
+                buf.write(f"\n\n### {filename} [unchanged since last review, hash={digest}]")
+                continue
+            self._last_qa_hashes[hash_key] = digest
+
+            buf.write(f"\n\n### {filename}")
             if description:
-                summary_parts.append(f"Description: {description}")
-            summary_parts.append(f"```\n{content}\n```")
-        
-        setup = self.backend_code.get("setup_instructions", "")
+                buf.write(f"\nDescription: {description}")
+            buf.write(f"\n```\n{self._file_content(file_info)}\n```")
+
+        setup = code_output.get("setup_instructions", "")
         if setup:
-            summary_parts.append(f"\nSetup: {setup}")
-        
-        return "\n".join(summary_parts)
+            buf.write(f"\n\nSetup: {setup}")
+
+        return buf.getvalue()
+
+    def _format_backend_code_full(self) -> str:
+        """Format full backend code for QA context."""
+        if not self.backend_code:
+            return "No backend code available."
+
+        return self._format_code_full(self.backend_code, "## Backend Code:", "backend")
     
     def _format_frontend_code_full(self) -> str:
         """Format full frontend code for QA context."""
         if not self.frontend_code:
             return "No frontend code available."
-        
-        summary_parts = ["## Frontend Code:"]
-        
-        files = self.frontend_code.get("files", [])
-        for file_info in files:
-            filename = file_info.get("filename", "")
-            content = file_info.get("content", "")
-            description = file_info.get("description", "")
-            
-            summary_parts.append(f"\n### {filename}")
-            if description:
-                summary_parts.append(f"Description: {description}")
-            summary_parts.append(f"```\n{content}\n```")
-        
-        setup = self.frontend_code.get("setup_instructions", "")
-        if setup:
-            summary_parts.append(f"\nSetup: {setup}")
-        
-        return "\n".join(summary_parts)
+
+        return self._format_code_full(self.frontend_code, "## Frontend Code:", "frontend")
     
     def _format_qa_feedback(self, agent_name: str) -> str:
         """Format QA feedback specific to an agent."""
         if not self.test_report:
             return ""
-        
+
+        cache_key = f"qa_feedback:{agent_name}"
+        cached = self._fmt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         feedback_parts = []
         
         issues_by_agent = self.test_report.get("issues_by_agent", {})
@@ -241,14 +549,8 @@ class ContextManager:
             for issue in agent_issues:
                 feedback_parts.append(f"  - {issue}")
         
-        test_cases = self.test_report.get("test_cases", [])
-        failed_tests = [
-            tc for tc in test_cases
-            if isinstance(tc, dict) 
-            and tc.get("status", "").lower() == "fail"
-            and tc.get("responsible_agent") == agent_name
-        ]
-        
+        failed_tests = self._qa_failed_by_agent.get(agent_name, [])
+
         if failed_tests:
             feedback_parts.append("\nFailed test cases:")
             for tc in failed_tests:
@@ -261,8 +563,10 @@ class ContextManager:
             feedback_parts.append("\nRecommendations:")
             for rec in recommendations:
                 feedback_parts.append(f"  - {rec}")
-        
-        return "\n".join(feedback_parts) if feedback_parts else ""
+
+        feedback = "\n".join(feedback_parts) if feedback_parts else ""
+        self._fmt_cache[cache_key] = feedback
+        return feedback
     
     def _format_previous_output_summary(self, agent_name: str) -> str:
         """Format previous output for an agent to reference during iteration."""
@@ -271,162 +575,252 @@ class ContextManager:
         elif agent_name == AGENT_ARCHITECT and self.system_design:
             return f"\n## Your Previous System Design (to be updated):\n{self._format_system_design_summary()}"
         elif agent_name == AGENT_BACKEND_ENGINEER and self.backend_code:
-            files = self.backend_code.get("files", [])
-            file_list = ", ".join(f.get("filename", "") for f in files)
-            return f"\n## Your Previous Backend Files (to be updated): {file_list}"
+            return f"\n## Your Previous Backend Files (to be updated): {self._backend_file_list}"
         elif agent_name == AGENT_FRONTEND_ENGINEER and self.frontend_code:
-            files = self.frontend_code.get("files", [])
-            file_list = ", ".join(f.get("filename", "") for f in files)
-            return f"\n## Your Previous Frontend Files (to be updated): {file_list}"
+            return f"\n## Your Previous Frontend Files (to be updated): {self._frontend_file_list}"
         return ""
     
+    def _aggregate_test_cases(self):
+        """Aggregate the test report in one pass over its test cases.
+
+        Returns (passed_count, failed_cases, agents_with_issues); the
+        result is cached until a new report is stored.
+        """
+        if self._test_report_aggregate is not None:
+            return self._test_report_aggregate
+
+        status_counts: Counter = Counter()
+        failed_cases: List[Dict] = []
+        agents_with_issues: Set[str] = set()
+
+        if self.test_report:
+            for agent, issues in self.test_report.get("issues_by_agent", {}).items():
+                if issues:
+                    agents_with_issues.add(agent)
+
+            # Statuses are lowercased at ingest by update_test_report.
+            for tc in self.test_report.get("test_cases", []):
+                if not isinstance(tc, dict):
+                    continue
+                status = tc.get("status", "")
+                status_counts[status] += 1
+                if status == "fail":
+                    failed_cases.append(tc)
+                    responsible_agent = tc.get("responsible_agent", "")
+                    if responsible_agent:
+                        agents_with_issues.add(responsible_agent)
+
+        self._test_report_aggregate = (status_counts["pass"], failed_cases, agents_with_issues)
+        return self._test_report_aggregate
+
     def _format_test_report_summary(self) -> str:
         """Format test report summary for manager context."""
         if not self.test_report:
             return "No test report available."
-        
-        summary_parts = ["## QA Test Report:"]
-        
+
+        cached = self._fmt_cache.get("test_report_summary")
+        if cached is not None:
+            return cached
+
+        buf = io.StringIO()
+        buf.write("## QA Test Report:")
+
         overall_status = self.test_report.get("overall_status", "unknown")
-        summary_parts.append(f"Overall Status: {overall_status}")
-        
-        summary = self.test_report.get("summary", "")
-        if summary:
-            summary_parts.append(f"Summary: {summary}")
-        
+        buf.write(f"\nOverall Status: {overall_status}")
+
+        report_summary = self.test_report.get("summary", "")
+        if report_summary:
+            buf.write(f"\nSummary: {report_summary}")
+
         # Test cases
         test_cases = self.test_report.get("test_cases", [])
         if test_cases:
-            passed = sum(1 for tc in test_cases if tc.get("status", "").lower() == "pass")
-            failed = sum(1 for tc in test_cases if tc.get("status", "").lower() == "fail")
-            summary_parts.append(f"\nTest Results: {passed} passed, {failed} failed, {len(test_cases)} total")
-            
-            # List failed tests
-            failed_tests = [tc for tc in test_cases if tc.get("status", "").lower() == "fail"]
-            if failed_tests:
-                summary_parts.append("\nFailed Tests:")
-                for tc in failed_tests:
+            passed, failed_cases, _ = self._aggregate_test_cases()
+            buf.write(f"\n\nTest Results: {passed} passed, {len(failed_cases)} failed, {len(test_cases)} total")
+
+            if failed_cases:
+                buf.write("\n\nFailed Tests:")
+                for tc in sorted(failed_cases, key=lambda tc: str(tc.get("id", ""))):
                     responsible = tc.get("responsible_agent", "unknown")
-                    summary_parts.append(f"  - [{tc.get('id')}] {tc.get('description')} (responsible: {responsible})")
+                    buf.write(f"\n  - [{tc.get('id')}] {tc.get('description')} (responsible: {responsible})")
                     if tc.get("notes"):
-                        summary_parts.append(f"    Notes: {tc.get('notes')}")
-        
+                        buf.write(f"\n    Notes: {tc.get('notes')}")
+
         # Issues by agent
         issues_by_agent = self.test_report.get("issues_by_agent", {})
         has_issues = any(issues for issues in issues_by_agent.values())
         if has_issues:
-            summary_parts.append("\nIssues by Agent:")
-            for agent, issues in issues_by_agent.items():
+            buf.write("\n\nIssues by Agent:")
+            agent_rank = len(_AGENT_CANONICAL_ORDER)
+            for agent in sorted(
+                issues_by_agent,
+                key=lambda name: (_AGENT_CANONICAL_ORDER.get(name, agent_rank), name)
+            ):
+                issues = issues_by_agent[agent]
                 if issues:
-                    summary_parts.append(f"  {agent}:")
+                    buf.write(f"\n  {agent}:")
                     for issue in issues:
-                        summary_parts.append(f"    - {issue}")
-        
+                        buf.write(f"\n    - {issue}")
+
         # Recommendations
         recommendations = self.test_report.get("recommendations", [])
         if recommendations:
-            summary_parts.append("\nRecommendations:")
+            buf.write("\n\nRecommendations:")
             for rec in recommendations:
-                summary_parts.append(f"  - {rec}")
-        
-        return "\n".join(summary_parts)
-    
+                buf.write(f"\n  - {rec}")
+
+        summary = buf.getvalue()
+        self._fmt_cache["test_report_summary"] = summary
+        return summary
+
+    def _render_static_prefix(self) -> str:
+        """Render the stable requirements/design prefix shared by all agents.
+
+        The prefix is byte-identical between phase updates and only grows
+        (append-only) as phases complete, so LLM provider prompt caches can
+        reuse it across agents and iterations. Volatile blocks (QA feedback,
+        iteration counters) must always come after this prefix.
+        """
+        cache_key = (id(self.user_stories), id(self.system_design))
+        cached = self._static_prefix_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        prefix_parts = [f"## Project Requirements:\n{self.vibe_prompt}"]
+        if self.user_stories:
+            prefix_parts.append(self._format_user_stories_summary())
+        if self.system_design:
+            prefix_parts.append(self._format_system_design_summary())
+
+        prefix = "\n\n".join(prefix_parts)
+        self._static_prefix_cache = {cache_key: prefix}
+        return prefix
+
+    @staticmethod
+    def _append_if_meaningful(parts: List[str], text: str):
+        """Append a context block only if it carries real content."""
+        if text and text not in _EMPTY_SECTIONS:
+            parts.append(text)
+
     def get_context_for_product_owner(self, is_iteration: bool = False) -> str:
         """Get context for Product Owner."""
-        context_parts = [f"## Project Requirements:\n{self.vibe_prompt}"]
-        
+        cache_key = f"context:product_owner:{is_iteration}"
+        cached = self._fmt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        context_parts = [self._render_static_prefix()]
+
         if is_iteration:
-            prev_output = self._format_previous_output_summary(AGENT_PRODUCT_OWNER)
-            if prev_output:
-                context_parts.append(prev_output)
-            
+            # The static prefix already carries the latest user stories,
+            # so only the volatile QA feedback is appended here.
             qa_feedback = self._format_qa_feedback(AGENT_PRODUCT_OWNER)
             if qa_feedback:
                 context_parts.append(f"\n## QA Feedback (Please address these issues):\n{qa_feedback}")
-        
-        return "\n\n".join(context_parts)
-    
+
+        context = "\n\n".join(context_parts)
+        self._fmt_cache[cache_key] = context
+        return context
+
     def get_context_for_architect(self, is_iteration: bool = False) -> str:
         """Get context for Architect."""
-        context_parts = [self._format_user_stories_summary()]
-        
+        cache_key = f"context:architect:{is_iteration}"
+        cached = self._fmt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        context_parts = [self._render_static_prefix()]
+
         if is_iteration:
-            prev_output = self._format_previous_output_summary(AGENT_ARCHITECT)
-            if prev_output:
-                context_parts.append(prev_output)
-            
+            # The static prefix already carries the latest system design,
+            # so only the volatile QA feedback is appended here.
             qa_feedback = self._format_qa_feedback(AGENT_ARCHITECT)
             if qa_feedback:
                 context_parts.append(f"\n## QA Feedback (Please address these issues):\n{qa_feedback}")
-        
-        return "\n\n".join(context_parts)
-    
+
+        context = "\n\n".join(context_parts)
+        self._fmt_cache[cache_key] = context
+        return context
+
     def get_context_for_backend_engineer(self, is_iteration: bool = False) -> str:
         """Get context for Backend Engineer."""
-        context_parts = [
-            self._format_user_stories_summary(),
-            self._format_system_design_summary()
-        ]
-        
+        cache_key = f"context:backend_engineer:{is_iteration}"
+        cached = self._fmt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        context_parts = [self._render_static_prefix()]
+
         if is_iteration:
             prev_output = self._format_previous_output_summary(AGENT_BACKEND_ENGINEER)
             if prev_output:
                 context_parts.append(prev_output)
-            
+
             qa_feedback = self._format_qa_feedback(AGENT_BACKEND_ENGINEER)
             if qa_feedback:
                 context_parts.append(f"\n## QA Feedback (Please address these issues):\n{qa_feedback}")
-        
-        return "\n\n".join(context_parts)
-    
+
+        context = "\n\n".join(context_parts)
+        self._fmt_cache[cache_key] = context
+        return context
+
     def get_context_for_frontend_engineer(self, is_iteration: bool = False) -> str:
         """Get context for Frontend Engineer."""
-        context_parts = [
-            self._format_user_stories_summary(),
-            self._format_system_design_summary(),
-            self._format_backend_endpoints_summary()
-        ]
-        
+        cache_key = f"context:frontend_engineer:{is_iteration}"
+        cached = self._fmt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        context_parts = [self._render_static_prefix()]
+        self._append_if_meaningful(context_parts, self._format_backend_endpoints_summary())
+
         if is_iteration:
             prev_output = self._format_previous_output_summary(AGENT_FRONTEND_ENGINEER)
             if prev_output:
                 context_parts.append(prev_output)
-            
+
             qa_feedback = self._format_qa_feedback(AGENT_FRONTEND_ENGINEER)
             if qa_feedback:
                 context_parts.append(f"\n## QA Feedback (Please address these issues):\n{qa_feedback}")
-        
-        return "\n\n".join(context_parts)
-    
+
+        context = "\n\n".join(context_parts)
+        self._fmt_cache[cache_key] = context
+        return context
+
     def get_context_for_qa_engineer(self) -> str:
         """Get context for QA Engineer."""
-        context_parts = [
-            self._format_user_stories_summary(),
-            self._format_system_design_summary(),
-            self._format_backend_code_full(),
-            self._format_frontend_code_full()
-        ]
-        
+        context_parts = [self._render_static_prefix()]
+        self._append_if_meaningful(context_parts, self._format_backend_code_full())
+        self._append_if_meaningful(context_parts, self._format_frontend_code_full())
+
         return "\n\n".join(context_parts)
-    
+
     def get_context_for_manager(self, iteration: int, max_iterations: int) -> str:
         """Get context for Manager to make decisions."""
-        context_parts = [
-            f"## Iteration Status: {iteration}/{max_iterations}",
-            f"\n## Original Requirements:\n{self.vibe_prompt}",
-            f"\n{self._format_test_report_summary()}"
-        ]
-        
+        # Static prefix first, per-iteration counter last, so the bulk of
+        # the manager prompt stays byte-stable across iterations.
+        context_parts = [self._render_static_prefix()]
+        self._append_if_meaningful(context_parts, self._format_test_report_summary())
+        context_parts.append(f"## Iteration Status: {iteration}/{max_iterations}")
+
         return "\n\n".join(context_parts)
-    
+
     def clear(self):
         """Clear all stored context data to free memory."""
         self.vibe_prompt = ""
+        self.project_dir = None
         self.user_stories = None
         self.system_design = None
         self.backend_code = None
         self.frontend_code = None
         self.test_report = None
+        self._static_prefix_cache = {}
+        self._fmt_cache = {}
+        self._test_report_aggregate = None
+        self._last_qa_hashes = {}
+        self._qa_failed_by_agent = {}
+        self._backend_file_list = ""
+        self._frontend_file_list = ""
 
 
 class PentagonCrew:
@@ -438,25 +832,82 @@ class PentagonCrew:
     
     MAX_QA_ITERATIONS = 5
     MAX_RETRIES = 2
+    # Verbose output is flushed in batches of this many lines (and at
+    # phase boundaries) instead of one syscall per message.
+    _LOG_FLUSH_EVERY = 16
+    # Peak RSS (KB, ru_maxrss units on Linux) above which cleanup runs a
+    # full-heap gc pass in addition to the cheap young/middle sweep.
+    _FULL_GC_RSS_KB = 2 * 1024 * 1024
+
+    # Built once at class-definition time; only {context} varies per call.
+    _MANAGER_TASK_TEMPLATE = """You are the Project Manager. Review the QA test report and decide which team members need to fix issues.
+
+{context}
+
+Based on the QA report, analyze:
+1. Which agents are responsible for the failed tests?
+2. Are there any dependency implications? (e.g., if architect needs changes, backend and frontend may need updates too)
+3. Should we continue iterating or is the project good enough?
+
+Return ONLY this JSON structure (no markdown, no extra text):
+{{
+    "should_continue": true,
+    "agents_to_rerun": ["backend_engineer", "frontend_engineer"],
+    "reasoning": "Brief explanation of why these agents need to re-run",
+    "iteration_goal": "Specific goal for this iteration"
+}}
+
+RULES:
+- should_continue: true if there are issues to fix, false if QA passed or issues are minor
+- agents_to_rerun: list of agent identifiers that need to fix issues
+  Valid values: "product_owner", "architect", "backend_engineer", "frontend_engineer"
+- Include dependent agents (if architect re-runs, include backend_engineer and frontend_engineer)
+- Keep reasoning and iteration_goal under 100 characters each
+- Return ONLY valid JSON"""
+
+    _MANAGER_EXPECTED_OUTPUT = """Valid JSON with should_continue, agents_to_rerun, reasoning, and iteration_goal"""
     
     def __init__(self, verbose: bool = True, output_dir: str = "output"):
         self.verbose = verbose
         self.output_dir = output_dir
         self.execution_log = []
         self.context_manager = ContextManager()
-        
+        # One reusable Crew per agent; see _get_or_build_crew.
+        self._crew_cache: Dict[int, Crew] = {}
+        # Tasks created since the last iteration boundary; their raw LLM
+        # outputs are released in _release_transient.
+        self._iteration_tasks: List[Task] = []
+        # Hash of the last serialized payload per phase file, used to skip
+        # rewriting unchanged phases across QA iterations.
+        self._last_phase_hash: Dict[str, int] = {}
+        # Phases re-run since the last save; iteration saves only
+        # serialize these instead of all five files.
+        self._dirty_phases: Set[str] = set()
+        self._log_buf: List[str] = []
+        # Base task description per factory; descriptions embed the prompt,
+        # so this is per-instance rather than module-level.
+        self._base_desc_cache: Dict[Any, str] = {}
+
     def _log(self, message: str):
         """Log execution progress."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        # time.strftime formats in C without building a datetime object
+        log_entry = f"[{time.strftime('%H:%M:%S')}] {message}"
         self.execution_log.append(log_entry)
         if self.verbose:
-            print(log_entry)
+            self._log_buf.append(log_entry)
+            if len(self._log_buf) >= self._LOG_FLUSH_EVERY:
+                self._flush_log()
+
+    def _flush_log(self):
+        """Write buffered verbose output in one pass."""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
     
     def _create_project_dir(self, vibe_prompt: str) -> Path:
         """Create project output directory."""
-        safe_name = "".join(c if c.isalnum() or c in ' -_' else '_' for c in vibe_prompt[:40])
-        safe_name = safe_name.strip().replace(' ', '_').lower()
+        safe_name = _UNSAFE_NAME_CHARS.sub('_', vibe_prompt[:40]).strip().replace(' ', '_').lower()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         project_name = f"{safe_name}_{timestamp}"
         
@@ -469,13 +920,41 @@ class PentagonCrew:
         
         return project_dir
     
+    def _get_or_build_crew(self, agent: Agent, task: Task) -> Crew:
+        """Reuse one Crew instance per agent, swapping in the task to run.
+
+        Crew construction re-validates agents and rebuilds internal state
+        on every call; reusing the instance keeps per-kickoff overhead to
+        the task itself.
+        """
+        crew = self._crew_cache.get(id(agent))
+        if crew is None:
+            crew = Crew(
+                agents=[agent],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=self.verbose
+            )
+            self._crew_cache[id(agent)] = crew
+        else:
+            crew.tasks = [task]
+        return crew
+
     def _save_json(self, path: Path, data: Any):
         """Save data as JSON."""
-        with open(path, 'w', encoding='utf-8') as f:
-            if isinstance(data, str):
+        if isinstance(data, str):
+            with open(path, 'w', encoding='utf-8') as f:
                 f.write(data)
-            else:
-                json.dump(data, f, indent=2, default=str)
+            return
+        # orjson serializes in C and emits bytes in one shot, which is
+        # several times faster than json.dump on the large nested phase
+        # payloads written here.
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(_to_jsonable(data), option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(_to_jsonable(data), f, indent=2, default=str)
     
     def _extract_output(self, task_output, schema_class=None) -> Dict[str, Any]:
         """Extract and validate output from task."""
@@ -507,6 +986,20 @@ class PentagonCrew:
                 result["success"] = True
                 return result
             
+            # Fast path: well-formed JSON (the common case) parses in C;
+            # safe_parse_json's recovery machinery only runs when needed.
+            if orjson is not None:
+                try:
+                    parsed = orjson.loads(result["raw"])
+                    if isinstance(parsed, dict):
+                        if schema_class is not None:
+                            parsed = schema_class.model_validate(parsed).model_dump()
+                        result["data"] = parsed
+                        result["success"] = True
+                        return result
+                except Exception:
+                    pass
+
             # Parse raw output with recovery
             success, parsed = safe_parse_json(result["raw"], schema_class)
             if success:
@@ -523,34 +1016,32 @@ class PentagonCrew:
         
         return result
     
-    def _execute_task_with_recovery(
+    async def _execute_task_with_recovery_async(
         self,
         agent: Agent,
         task: Task,
         schema_class,
         max_retries: int = None
     ) -> Dict[str, Any]:
-        """Execute a task with retry and truncation recovery."""
+        """Execute a task with retry and truncation recovery (awaitable).
+
+        Awaiting crew.kickoff_async() keeps the event loop free while the
+        LLM call is in flight, so independent agents can run concurrently.
+        """
         if max_retries is None:
             max_retries = self.MAX_RETRIES
-            
+
         last_error = None
         last_raw = ""
-        
+
         for attempt in range(max_retries + 1):
             try:
                 if attempt > 0:
                     self._log(f"    Retry attempt {attempt}/{max_retries}...")
-                
-                # Create a fresh crew for each attempt
-                crew = Crew(
-                    agents=[agent],
-                    tasks=[task],
-                    process=Process.sequential,
-                    verbose=self.verbose
-                )
-                crew.kickoff()
-                
+
+                crew = self._get_or_build_crew(agent, task)
+                await crew.kickoff_async()
+
                 # Extract output
                 output = self._extract_output(task.output, schema_class)
                 
@@ -604,35 +1095,71 @@ class PentagonCrew:
             "raw": last_raw,
             "error": f"Failed after {max_retries + 1} attempts. Last error: {last_error}"
         }
-    
-    def _create_manager_decision_task(self, manager_agent: Agent, context: str) -> Task:
-        """Create a task for the manager to decide which agents need to re-run."""
-        return Task(
-            description=f"""You are the Project Manager. Review the QA test report and decide which team members need to fix issues.
 
-{context}
+    def _execute_task_with_recovery(
+        self,
+        agent: Agent,
+        task: Task,
+        schema_class,
+        max_retries: int = None
+    ) -> Dict[str, Any]:
+        """Execute a task with retry and truncation recovery."""
+        return asyncio.run(
+            self._execute_task_with_recovery_async(agent, task, schema_class, max_retries)
+        )
 
-Based on the QA report, analyze:
-1. Which agents are responsible for the failed tests?
-2. Are there any dependency implications? (e.g., if architect needs changes, backend and frontend may need updates too)
-3. Should we continue iterating or is the project good enough?
+    def _rerun_waves(self, agents_to_rerun: List[str]) -> List[List[str]]:
+        """Split an ordered rerun list into dependency waves.
 
-Return ONLY this JSON structure (no markdown, no extra text):
-{{
-    "should_continue": true,
-    "agents_to_rerun": ["backend_engineer", "frontend_engineer"],
-    "reasoning": "Brief explanation of why these agents need to re-run",
-    "iteration_goal": "Specific goal for this iteration"
-}}
+        Agents within one wave have no dependency edge between them, so
+        their LLM calls can run concurrently; waves execute in order.
+        """
+        waves: List[List[str]] = []
+        current: List[str] = []
 
-RULES:
-- should_continue: true if there are issues to fix, false if QA passed or issues are minor
-- agents_to_rerun: list of agent identifiers that need to fix issues
-  Valid values: "product_owner", "architect", "backend_engineer", "frontend_engineer"
-- Include dependent agents (if architect re-runs, include backend_engineer and frontend_engineer)
-- Keep reasoning and iteration_goal under 100 characters each
-- Return ONLY valid JSON""",
-            expected_output="""Valid JSON with should_continue, agents_to_rerun, reasoning, and iteration_goal""",
+        for agent_name in agents_to_rerun:
+            blocked = any(
+                agent_name in AGENT_DEPENDENCIES.get(upstream, [])
+                for upstream in current
+            )
+            if blocked:
+                waves.append(current)
+                current = []
+            current.append(agent_name)
+
+        if current:
+            waves.append(current)
+        return waves
+
+    async def _execute_wave(self, agents: Dict[str, Agent], wave_specs: List) -> List[Dict[str, Any]]:
+        """Run one wave of independent agent tasks concurrently.
+
+        Exceptions are captured per agent so one failing member cannot
+        cancel its siblings mid-flight; context updates happen after the
+        whole wave completes, on the caller's thread, so no locking is
+        needed around the ContextManager.
+        """
+        outputs = await asyncio.gather(
+            *(
+                self._execute_task_with_recovery_async(agents[agent_name], task, schema_class)
+                for agent_name, task, schema_class, _phase_key, _updater in wave_specs
+            ),
+            return_exceptions=True
+        )
+
+        normalized = []
+        for spec, output in zip(wave_specs, outputs):
+            if isinstance(output, BaseException):
+                self._log(f"    WARNING: {spec[0]} wave execution raised: {output}")
+                output = {"success": False, "data": None, "raw": "", "error": str(output)}
+            normalized.append(output)
+        return normalized
+
+    def _create_manager_decision_task(self, manager_agent: Agent, context: str) -> Task:
+        """Create a task for the manager to decide which agents need to re-run."""
+        return Task(
+            description=self._MANAGER_TASK_TEMPLATE.format(context=context),
+            expected_output=self._MANAGER_EXPECTED_OUTPUT,
             agent=manager_agent
         )
     
@@ -648,18 +1175,23 @@ RULES:
         try:
             context = self.context_manager.get_context_for_manager(iteration, max_iterations)
             task = self._create_manager_decision_task(manager_agent, context)
-            
-            crew = Crew(
-                agents=[manager_agent],
-                tasks=[task],
-                process=Process.sequential,
-                verbose=self.verbose
-            )
+
+            crew = self._get_or_build_crew(manager_agent, task)
             crew.kickoff()
             
-            # Extract manager's decision
+            # Extract manager's decision; try the strict C parser first and
+            # only fall back to recovery parsing on malformed output
             raw = task.output.raw if hasattr(task.output, 'raw') else str(task.output)
-            success, parsed = safe_parse_json(raw)
+            parsed = None
+            if orjson is not None:
+                try:
+                    parsed = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    parsed = None
+            if isinstance(parsed, dict):
+                success = True
+            else:
+                success, parsed = safe_parse_json(raw)
             
             if success and isinstance(parsed, dict):
                 decision.should_continue = parsed.get("should_continue", False)
@@ -707,48 +1239,22 @@ RULES:
     
     def _get_agents_with_issues_from_report(self) -> Set[str]:
         """Extract which agents have issues from the stored test report."""
-        agents_with_issues = set()
-        
         if not self.context_manager.test_report:
-            return agents_with_issues
-        
-        data = self.context_manager.test_report
-        
-        # Check issues_by_agent field
-        issues_by_agent = data.get("issues_by_agent", {})
-        for agent, issues in issues_by_agent.items():
-            if issues:
-                agents_with_issues.add(agent)
-        
-        # Check test_cases for responsible_agent on failed tests
-        test_cases = data.get("test_cases", [])
-        for tc in test_cases:
-            if isinstance(tc, dict):
-                status = tc.get("status", "").lower()
-                responsible_agent = tc.get("responsible_agent", "")
-                if status == "fail" and responsible_agent:
-                    agents_with_issues.add(responsible_agent)
-        
-        return agents_with_issues
+            return set()
+
+        _passed, _failed_cases, agents_with_issues = self.context_manager._aggregate_test_cases()
+        # Copy so callers can't mutate the cached aggregate.
+        return set(agents_with_issues)
     
     def _add_agent_dependencies(self, agents: List[str]) -> List[str]:
         """Add dependent agents and return in correct execution order."""
         agents_to_rerun = set(agents)
-        
-        # Add downstream dependencies
+
+        # Add downstream dependencies via the precomputed closure
         for agent in agents:
-            if agent in AGENT_DEPENDENCIES:
-                agents_to_rerun.update(AGENT_DEPENDENCIES[agent])
-        
-        # Return in correct execution order
-        execution_order = [
-            AGENT_PRODUCT_OWNER,
-            AGENT_ARCHITECT,
-            AGENT_BACKEND_ENGINEER,
-            AGENT_FRONTEND_ENGINEER
-        ]
-        
-        return [agent for agent in execution_order if agent in agents_to_rerun]
+            agents_to_rerun |= AGENT_DOWNSTREAM_CLOSURE.get(agent, frozenset())
+
+        return [agent for agent in EXECUTION_ORDER if agent in agents_to_rerun]
     
     def _save_code_files(self, project_dir: Path, code_output: Dict, subfolder: str):
         """Save code files to disk."""
@@ -756,117 +1262,90 @@ RULES:
             return
         
         target_dir = project_dir / subfolder
-        for file_info in code_output["files"]:
-            if isinstance(file_info, dict) and "filename" in file_info and "content" in file_info:
-                filepath = target_dir / file_info["filename"]
-                content = file_info["content"]
-                if isinstance(content, str):
-                    # Unescape content
-                    content = content.replace('\\n', '\n').replace('\\t', '\t')
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                self._log(f"    Saved: {filepath}")
+        files = [
+            file_info for file_info in code_output["files"]
+            if isinstance(file_info, dict) and "filename" in file_info and "content" in file_info
+        ]
+
+        # One mkdir per unique parent up front instead of a stat per file;
+        # this also covers nested filenames like routers/users.py, which
+        # previously failed because only the top-level directory existed.
+        for parent in {(target_dir / file_info["filename"]).parent for file_info in files}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        for file_info in files:
+            filepath = target_dir / file_info["filename"]
+            content = file_info["content"]
+            if isinstance(content, str):
+                # Unescape content
+                content = _UNESCAPE_RE.sub(lambda m: _UNESCAPE_MAP[m.group()], content)
+            filepath.write_text(content, encoding='utf-8')
+            self._log(f"    Saved: {filepath}")
     
     def _create_readme(self, project_dir: Path, vibe_prompt: str, results: Dict):
         """Create README for the project."""
         test_report_data = results.get('phases', {}).get('test_report', {}).get('data', {})
         overall_status = test_report_data.get('overall_status', 'N/A') if test_report_data else 'N/A'
-        
-        readme_content = f"""# Generated Project
-
-            ## Original Vibe Prompt
-            {vibe_prompt}
-
-            ## Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-            ## Project Structure
-            ```
-            {project_dir.name}/
-            ├── backend/          # Python FastAPI backend
-            ├── frontend/         # HTML/CSS/JS frontend
-            ├── phases/           # Intermediate outputs
-            └── README.md
-            ```
-
-            ## How to Run
-
-            ### Backend
-            ```bash
-            cd backend
-            pip install fastapi uvicorn
-            uvicorn main:app --reload --port 8000
-            ```
-
-            ### Frontend
-            ```bash
-            cd frontend
-            # Open index.html in a browser
-            # Or use a simple server:
-            python -m http.server 3000
-            ```
-
-            ## Test Results
-            - Overall Status: {overall_status}
-            - QA Iterations: {results.get('qa_iterations', 'N/A')}
-            - Success: {results.get('success', False)}
-
-            ## Errors
-            {chr(10).join(results.get('errors', [])) if results.get('errors') else 'None'}
-
-            Generated by Pentagon Protocol - Schema-Guided Vibe Coding Framework
-            """
-        
-        with open(project_dir / "README.md", 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        errors = results.get('errors')
+        errors_joined = "\n".join(errors) if errors else "None"
+
+        readme_content = _README_TMPL.format(
+            vibe_prompt=vibe_prompt,
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            project_name=project_dir.name,
+            overall_status=overall_status,
+            qa_iterations=results.get('qa_iterations', 'N/A'),
+            success=results.get('success', False),
+            errors_joined=errors_joined,
+        )
+
+        (project_dir / "README.md").write_text(readme_content, encoding='utf-8')
 
     def _check_qa_passed(self, qa_output: Dict[str, Any]) -> bool:
         """Check if QA has no issues (pass condition)."""
         if not qa_output or not qa_output.get("success"):
             return False
-        
+
         data = qa_output.get("data", {})
-        
+
         # Check overall_status is "pass"
         overall_status = data.get("overall_status", "").lower()
         if overall_status != "pass":
             return False
-        
-        # Check all test cases passed (no failed tests)
-        test_cases = data.get("test_cases", [])
-        for tc in test_cases:
-            if isinstance(tc, dict) and tc.get("status", "").lower() == "fail":
-                return False
-        
-        return True
+
+        # Single short-circuiting scan for any failed test case
+        return not any(
+            tc.get("status") in _FAIL_STATUSES
+            for tc in data.get("test_cases", [])
+            if isinstance(tc, dict)
+        )
 
     def _get_agents_with_issues(self, qa_output: Dict[str, Any]) -> Set[str]:
         """Extract which agents have issues from QA report."""
-        agents_with_issues = set()
-        
         if not qa_output or not qa_output.get("success"):
-            return agents_with_issues
-        
+            return set()
+
         data = qa_output.get("data", {})
-        
-        # Check issues_by_agent field first
-        issues_by_agent = data.get("issues_by_agent", {})
-        for agent, issues in issues_by_agent.items():
-            if issues:
-                agents_with_issues.add(agent)
-        
-        # Also check test_cases for responsible_agent on failed tests
-        test_cases = data.get("test_cases", [])
-        for tc in test_cases:
-            if isinstance(tc, dict):
-                status = tc.get("status", "").lower()
-                responsible_agent = tc.get("responsible_agent", "")
-                if status == "fail" and responsible_agent:
-                    agents_with_issues.add(responsible_agent)
-        
+
+        agents_with_issues = {
+            agent for agent, issues in data.get("issues_by_agent", {}).items() if issues
+        }
+        agents_with_issues |= {
+            tc["responsible_agent"]
+            for tc in data.get("test_cases", [])
+            if isinstance(tc, dict)
+            and tc.get("status") in _FAIL_STATUSES
+            and tc.get("responsible_agent")
+        }
         return agents_with_issues
 
-    def _save_phase_outputs(self, project_dir: Path, phase_outputs: Dict):
-        """Save all phase outputs to disk."""
+    def _save_phase_outputs(self, project_dir: Path, phase_outputs: Dict, only: Optional[Set[str]] = None):
+        """Save phase outputs to disk.
+
+        When `only` is given, phases outside it are not even serialized;
+        iteration saves pass the dirty-phase set so a three-iteration run
+        stops rewriting the files of phases that never re-ran.
+        """
         phase_files = {
             "user_stories": "01_user_stories.json",
             "system_design": "02_system_design.json",
@@ -874,61 +1353,95 @@ RULES:
             "frontend_code": "04_frontend_code.json",
             "test_report": "05_test_report.json",
         }
-        
+
+        phases_dir = project_dir / "phases"
+        phases_dir.mkdir(exist_ok=True)
+
+        # Serialize everything first, then write in one pass. Payloads
+        # whose bytes match the previous save are skipped entirely, which
+        # matters because the QA loop rewrites these files per iteration.
+        pending = []
         for phase_name, filename in phase_files.items():
+            if only is not None and phase_name not in only:
+                continue
             output = phase_outputs.get(phase_name)
-            if output:
-                save_data = output["data"] if output.get("success") else {
-                    "raw": output.get("raw", ""),
-                    "error": output.get("error")
-                }
-                self._save_json(project_dir / "phases" / filename, save_data)
+            if not output:
+                continue
+            save_data = output["data"] if output.get("success") else {
+                "raw": output.get("raw", ""),
+                "error": output.get("error")
+            }
+            if isinstance(save_data, str):
+                payload = save_data.encode('utf-8')
+            elif orjson is not None:
+                payload = orjson.dumps(_to_jsonable(save_data), option=orjson.OPT_INDENT_2, default=str)
+            else:
+                payload = json.dumps(_to_jsonable(save_data), indent=2, default=str).encode('utf-8')
+
+            digest = hash(payload)
+            if self._last_phase_hash.get(phase_name) == digest:
+                continue
+            self._last_phase_hash[phase_name] = digest
+            pending.append((phases_dir / filename, payload))
+
+        # Bare file-descriptor writes skip the buffered-IO wrapper; each
+        # payload is already a single bytes object.
+        for path, payload in pending:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
+    # label + one-liner summary per phase; _log_phase_results walks this
+    # instead of repeating the lookup/success/failure chain five times.
+    _PHASE_LOG_TABLE = (
+        ("user_stories", "User Stories",
+         lambda data: f"{len(data.get('stories', []))} stories created"),
+        ("system_design", "System Design",
+         lambda data: f"{len(data.get('models', []))} models, {len(data.get('endpoints', []))} endpoints"),
+        ("backend_code", "Backend Code",
+         lambda data: f"{len(data.get('files', []))} files created"),
+        ("frontend_code", "Frontend Code",
+         lambda data: f"{len(data.get('files', []))} files created"),
+        ("test_report", "Test Report",
+         lambda data: f"{len(data.get('test_cases', []))} tests, Status: {data.get('overall_status', 'unknown')}"),
+    )
 
     def _log_phase_results(self, phase_outputs: Dict):
         """Log results of each phase."""
-        if phase_outputs.get("user_stories") and phase_outputs["user_stories"].get("success"):
-            story_count = len(phase_outputs["user_stories"]["data"].get("stories", []))
-            self._log(f"    User Stories: {story_count} stories created")
-        elif phase_outputs.get("user_stories"):
-            self._log(f"    User Stories: FAILED - {phase_outputs['user_stories'].get('error', 'Unknown error')[:50]}")
-        
-        if phase_outputs.get("system_design") and phase_outputs["system_design"].get("success"):
-            model_count = len(phase_outputs["system_design"]["data"].get("models", []))
-            endpoint_count = len(phase_outputs["system_design"]["data"].get("endpoints", []))
-            self._log(f"    System Design: {model_count} models, {endpoint_count} endpoints")
-        elif phase_outputs.get("system_design"):
-            self._log(f"    System Design: FAILED - {phase_outputs['system_design'].get('error', 'Unknown error')[:50]}")
-        
-        if phase_outputs.get("backend_code") and phase_outputs["backend_code"].get("success"):
-            file_count = len(phase_outputs["backend_code"]["data"].get("files", []))
-            self._log(f"    Backend Code: {file_count} files created")
-        elif phase_outputs.get("backend_code"):
-            self._log(f"    Backend Code: FAILED - {phase_outputs['backend_code'].get('error', 'Unknown error')[:50]}")
-        
-        if phase_outputs.get("frontend_code") and phase_outputs["frontend_code"].get("success"):
-            file_count = len(phase_outputs["frontend_code"]["data"].get("files", []))
-            self._log(f"    Frontend Code: {file_count} files created")
-        elif phase_outputs.get("frontend_code"):
-            self._log(f"    Frontend Code: FAILED - {phase_outputs['frontend_code'].get('error', 'Unknown error')[:50]}")
-        
-        if phase_outputs.get("test_report") and phase_outputs["test_report"].get("success"):
-            status = phase_outputs["test_report"]["data"].get("overall_status", "unknown")
-            test_count = len(phase_outputs["test_report"]["data"].get("test_cases", []))
-            self._log(f"    Test Report: {test_count} tests, Status: {status}")
-        elif phase_outputs.get("test_report"):
-            self._log(f"    Test Report: FAILED - {phase_outputs['test_report'].get('error', 'Unknown error')[:50]}")
+        for phase_key, label, summarize in self._PHASE_LOG_TABLE:
+            output = phase_outputs.get(phase_key)
+            if not output:
+                continue
+            if output.get("success"):
+                self._log(f"    {label}: {summarize(output.get('data', {}))}")
+            else:
+                self._log(f"    {label}: FAILED - {(output.get('error') or 'Unknown error')[:50]}")
 
     def _cleanup_memory(self):
         """Clean up memory after project completion."""
         self._log("Cleaning up memory...")
         
-        # Clear context manager
+        # Clear context manager and cached crews (agents are rebuilt per run)
         self.context_manager.clear()
-        
-        # Force garbage collection
-        gc.collect()
-        
+        self._crew_cache.clear()
+        self._iteration_tasks.clear()
+        self._last_phase_hash.clear()
+        self._dirty_phases.clear()
+        self._base_desc_cache.clear()
+
+        # Return the objects frozen at run start to the normal generations,
+        # then collect. The young/middle sweep reclaims the per-run garbage;
+        # the full-heap pass only runs when peak RSS says it is worth it.
+        gc.unfreeze()
+        gc.collect(1)
+        if resource is not None and \
+                resource.getrusage(resource.RUSAGE_SELF).ru_maxrss > self._FULL_GC_RSS_KB:
+            gc.collect()
+
         self._log("Memory cleanup complete.")
+        self._flush_log()
 
     def _create_task_with_context(
         self, 
@@ -940,13 +1453,48 @@ RULES:
         """Create a task with custom context string injected into description."""
         # Create the base task
         task = task_factory(agent, original_arg)
-        
-        # Inject context into task description
+
+        # Inject context into task description. The base description of a
+        # factory is fixed for the run, so reruns reuse the cached string
+        # instead of re-reading it off the freshly built task.
         if context_str:
-            task.description = f"{task.description}\n\n--- CONTEXT ---\n{context_str}"
-        
+            base = self._base_desc_cache.setdefault(task_factory, task.description)
+            task.description = ''.join((base, _CTX_SEP, context_str))
+
+        self._iteration_tasks.append(task)
         return task
 
+    def _build_agent_task(
+        self,
+        agents: Dict[str, Agent],
+        agent_specs: Dict[str, tuple],
+        agent_name: str,
+        is_iteration: bool
+    ) -> tuple:
+        """Build an executable task spec for one agent from its dispatch entry.
+
+        Returns (agent_name, task, schema_class, phase_key, updater), the
+        shape consumed by _execute_wave and the sequential executor.
+        """
+        _label, _phase_title, context_getter, task_factory, task_arg, schema_class, phase_key, updater = \
+            agent_specs[agent_name]
+        context_str = context_getter(is_iteration=is_iteration)
+        task = self._create_task_with_context(task_factory, agents[agent_name], context_str, task_arg)
+        return (agent_name, task, schema_class, phase_key, updater)
+
+    def _release_transient(self):
+        """Release raw LLM outputs held by tasks from the last iteration.
+
+        Task objects keep the full raw response; once the extracted phase
+        outputs are stored and written to disk those buffers are dead
+        weight. A young/middle-generation collect reclaims them without
+        the full-heap pause of gc.collect().
+        """
+        for task in self._iteration_tasks:
+            task.output = None
+        self._iteration_tasks.clear()
+        gc.collect(1)
+
     def run(self, vibe_prompt: str) -> Dict[str, Any]:
         """
         Execute the Pentagon Protocol pipeline with iterative QA feedback.
@@ -966,6 +1514,7 @@ RULES:
         self._log(f"Vibe Prompt: {vibe_prompt}")
         
         project_dir = self._create_project_dir(vibe_prompt)
+        self.context_manager.project_dir = project_dir
         self._log(f"Output directory: {project_dir}")
         
         results = {
@@ -999,7 +1548,13 @@ RULES:
             
             for name, agent in agents.items():
                 self._log(f"  {name}: {agent.role}")
-            
+
+            # Agents, tools and prompt templates live for the whole run;
+            # freezing them keeps every later gc pass from re-traversing
+            # this large static object graph. _cleanup_memory unfreezes.
+            gc.freeze()
+
+
             # Store current outputs for each phase
             phase_outputs = {
                 "user_stories": None,
@@ -1008,102 +1563,68 @@ RULES:
                 "frontend_code": None,
                 "test_report": None,
             }
-            
+
+            # Dispatch table for the four buildable agents, shared by the
+            # initial pipeline and the QA rerun loop: (log label, phase
+            # title, context getter, task factory, task arg, schema,
+            # phase key, context updater).
+            agent_specs = {
+                AGENT_PRODUCT_OWNER: (
+                    "Product Owner", "User Stories",
+                    self.context_manager.get_context_for_product_owner,
+                    create_user_stories_task, vibe_prompt,
+                    UserStoriesOutput, "user_stories",
+                    self.context_manager.update_user_stories,
+                ),
+                AGENT_ARCHITECT: (
+                    "Architect", "System Design",
+                    self.context_manager.get_context_for_architect,
+                    create_system_design_task, [],
+                    SystemDesign, "system_design",
+                    self.context_manager.update_system_design,
+                ),
+                AGENT_BACKEND_ENGINEER: (
+                    "Backend Engineer", "Backend Code",
+                    self.context_manager.get_context_for_backend_engineer,
+                    create_backend_task, [],
+                    BackendCode, "backend_code",
+                    self.context_manager.update_backend_code,
+                ),
+                AGENT_FRONTEND_ENGINEER: (
+                    "Frontend Engineer", "Frontend Code",
+                    self.context_manager.get_context_for_frontend_engineer,
+                    create_frontend_task, [],
+                    FrontendCode, "frontend_code",
+                    self.context_manager.update_frontend_code,
+                ),
+            }
+
             # ============================================================
             # INITIAL RUN: All agents work on their tasks
             # ============================================================
             self._log("\n" + "="*50)
             self._log("INITIAL RUN: Full Pipeline Execution")
             self._log("="*50)
-            
-            # Phase 1: Product Owner - User Stories
-            self._log("\n  Phase 1: Product Owner - User Stories")
-            po_context = self.context_manager.get_context_for_product_owner(is_iteration=False)
-            po_task = self._create_task_with_context(
-                create_user_stories_task,
-                agents[AGENT_PRODUCT_OWNER],
-                po_context,
-                vibe_prompt
-            )
-            
-            phase_outputs["user_stories"] = self._execute_task_with_recovery(
-                agents[AGENT_PRODUCT_OWNER],
-                po_task,
-                UserStoriesOutput
-            )
-            self.context_manager.update_user_stories(phase_outputs["user_stories"])
-            
-            if not phase_outputs["user_stories"].get("success"):
-                error_msg = phase_outputs["user_stories"].get("error", "Unknown error")
-                self._log(f"    WARNING: User stories generation failed: {error_msg[:100]}")
-                results["errors"].append(f"User Stories: {error_msg}")
-            
-            # Phase 2: Architect - System Design
-            self._log("\n  Phase 2: Architect - System Design")
-            arch_context = self.context_manager.get_context_for_architect(is_iteration=False)
-            arch_task = self._create_task_with_context(
-                create_system_design_task,
-                agents[AGENT_ARCHITECT],
-                arch_context,
-                []
-            )
-            
-            phase_outputs["system_design"] = self._execute_task_with_recovery(
-                agents[AGENT_ARCHITECT],
-                arch_task,
-                SystemDesign
-            )
-            self.context_manager.update_system_design(phase_outputs["system_design"])
-            
-            if not phase_outputs["system_design"].get("success"):
-                error_msg = phase_outputs["system_design"].get("error", "Unknown error")
-                self._log(f"    WARNING: System design generation failed: {error_msg[:100]}")
-                results["errors"].append(f"System Design: {error_msg}")
-            
-            # Phase 3: Backend Engineer - Backend Code
-            self._log("\n  Phase 3: Backend Engineer - Backend Code")
-            be_context = self.context_manager.get_context_for_backend_engineer(is_iteration=False)
-            be_task = self._create_task_with_context(
-                create_backend_task,
-                agents[AGENT_BACKEND_ENGINEER],
-                be_context,
-                []
-            )
-            
-            phase_outputs["backend_code"] = self._execute_task_with_recovery(
-                agents[AGENT_BACKEND_ENGINEER],
-                be_task,
-                BackendCode
-            )
-            self.context_manager.update_backend_code(phase_outputs["backend_code"])
-            
-            if not phase_outputs["backend_code"].get("success"):
-                error_msg = phase_outputs["backend_code"].get("error", "Unknown error")
-                self._log(f"    WARNING: Backend code generation failed: {error_msg[:100]}")
-                results["errors"].append(f"Backend Code: {error_msg}")
-            
-            # Phase 4: Frontend Engineer - Frontend Code
-            self._log("\n  Phase 4: Frontend Engineer - Frontend Code")
-            fe_context = self.context_manager.get_context_for_frontend_engineer(is_iteration=False)
-            fe_task = self._create_task_with_context(
-                create_frontend_task,
-                agents[AGENT_FRONTEND_ENGINEER],
-                fe_context,
-                []
-            )
-            
-            phase_outputs["frontend_code"] = self._execute_task_with_recovery(
-                agents[AGENT_FRONTEND_ENGINEER],
-                fe_task,
-                FrontendCode
-            )
-            self.context_manager.update_frontend_code(phase_outputs["frontend_code"])
-            
-            if not phase_outputs["frontend_code"].get("success"):
-                error_msg = phase_outputs["frontend_code"].get("error", "Unknown error")
-                self._log(f"    WARNING: Frontend code generation failed: {error_msg[:100]}")
-                results["errors"].append(f"Frontend Code: {error_msg}")
-            
+
+            for phase_num, agent_name in enumerate(EXECUTION_ORDER, start=1):
+                label, phase_title = agent_specs[agent_name][:2]
+                self._log(f"\n  Phase {phase_num}: {label} - {phase_title}")
+
+                _name, task, schema_class, phase_key, updater = self._build_agent_task(
+                    agents, agent_specs, agent_name, is_iteration=False
+                )
+                phase_outputs[phase_key] = self._execute_task_with_recovery(
+                    agents[agent_name],
+                    task,
+                    schema_class
+                )
+                updater(phase_outputs[phase_key])
+
+                if not phase_outputs[phase_key].get("success"):
+                    error_msg = phase_outputs[phase_key].get("error", "Unknown error")
+                    self._log(f"    WARNING: {phase_title} generation failed: {error_msg[:100]}")
+                    results["errors"].append(f"{phase_title}: {error_msg}")
+
             # Phase 5: QA Engineer - Test Report
             self._log("\n  Phase 5: QA Engineer - Test Report")
             qa_context = self.context_manager.get_context_for_qa_engineer()
@@ -1127,13 +1648,15 @@ RULES:
                 results["errors"].append(f"Test Report: {error_msg}")
             
             results["qa_iterations"] = 1
-            
+
             # Save initial outputs
             self._save_phase_outputs(project_dir, phase_outputs)
+            self._release_transient()
             
             # Log initial results
             self._log("\n  Initial Run Results:")
             self._log_phase_results(phase_outputs)
+            self._flush_log()
             
             # ============================================================
             # ITERATIVE QA FEEDBACK LOOP WITH MANAGER COORDINATION
@@ -1167,13 +1690,13 @@ RULES:
                 )
                 
                 # Store decision for logging
-                results["manager_decisions"].append({
-                    "iteration": results["qa_iterations"],
-                    "should_continue": decision.should_continue,
-                    "agents_to_rerun": decision.agents_to_rerun,
-                    "reasoning": decision.reasoning,
-                    "iteration_goal": decision.iteration_goal
-                })
+                results["manager_decisions"].append(_MgrRecord(
+                    iteration=results["qa_iterations"],
+                    should_continue=decision.should_continue,
+                    agents_to_rerun=tuple(decision.agents_to_rerun),
+                    reasoning=(decision.reasoning or "")[:200],
+                    iteration_goal=(decision.iteration_goal or "")[:200],
+                ))
                 
                 self._log(f"  Manager Decision:")
                 self._log(f"    Continue: {decision.should_continue}")
@@ -1196,87 +1719,40 @@ RULES:
                 self._log(f"ITERATION {results['qa_iterations'] + 1}: {decision.iteration_goal}")
                 self._log("="*50)
                 
-                # Execute tasks for agents that need to re-run (in order)
-                for agent_name in decision.agents_to_rerun:
-                    if agent_name == AGENT_PRODUCT_OWNER:
-                        self._log(f"\n  Re-running: Product Owner")
-                        po_context = self.context_manager.get_context_for_product_owner(is_iteration=True)
-                        po_task = self._create_task_with_context(
-                            create_user_stories_task,
-                            agents[AGENT_PRODUCT_OWNER],
-                            po_context,
-                            vibe_prompt
-                        )
-                        
-                        phase_outputs["user_stories"] = self._execute_task_with_recovery(
-                            agents[AGENT_PRODUCT_OWNER],
-                            po_task,
-                            UserStoriesOutput
-                        )
-                        self.context_manager.update_user_stories(phase_outputs["user_stories"])
-                        
-                        if not phase_outputs["user_stories"].get("success"):
-                            self._log(f"    WARNING: User stories re-generation failed")
-                        
-                    elif agent_name == AGENT_ARCHITECT:
-                        self._log(f"\n  Re-running: Architect")
-                        arch_context = self.context_manager.get_context_for_architect(is_iteration=True)
-                        arch_task = self._create_task_with_context(
-                            create_system_design_task,
-                            agents[AGENT_ARCHITECT],
-                            arch_context,
-                            []
-                        )
-                        
-                        phase_outputs["system_design"] = self._execute_task_with_recovery(
-                            agents[AGENT_ARCHITECT],
-                            arch_task,
-                            SystemDesign
-                        )
-                        self.context_manager.update_system_design(phase_outputs["system_design"])
-                        
-                        if not phase_outputs["system_design"].get("success"):
-                            self._log(f"    WARNING: System design re-generation failed")
-                        
-                    elif agent_name == AGENT_BACKEND_ENGINEER:
-                        self._log(f"\n  Re-running: Backend Engineer")
-                        be_context = self.context_manager.get_context_for_backend_engineer(is_iteration=True)
-                        be_task = self._create_task_with_context(
-                            create_backend_task,
-                            agents[AGENT_BACKEND_ENGINEER],
-                            be_context,
-                            []
-                        )
-                        
-                        phase_outputs["backend_code"] = self._execute_task_with_recovery(
-                            agents[AGENT_BACKEND_ENGINEER],
-                            be_task,
-                            BackendCode
-                        )
-                        self.context_manager.update_backend_code(phase_outputs["backend_code"])
-                        
-                        if not phase_outputs["backend_code"].get("success"):
-                            self._log(f"    WARNING: Backend code re-generation failed")
-                        
-                    elif agent_name == AGENT_FRONTEND_ENGINEER:
-                        self._log(f"\n  Re-running: Frontend Engineer")
-                        fe_context = self.context_manager.get_context_for_frontend_engineer(is_iteration=True)
-                        fe_task = self._create_task_with_context(
-                            create_frontend_task,
-                            agents[AGENT_FRONTEND_ENGINEER],
-                            fe_context,
-                            []
-                        )
-                        
-                        phase_outputs["frontend_code"] = self._execute_task_with_recovery(
-                            agents[AGENT_FRONTEND_ENGINEER],
-                            fe_task,
-                            FrontendCode
+                # Deduplicate while preserving order; a duplicate entry
+                # from the manager would otherwise re-run the same
+                # expensive LLM task twice.
+                seen: Set[str] = set()
+                agents_to_rerun = [
+                    a for a in decision.agents_to_rerun
+                    if not (a in seen or seen.add(a))
+                ]
+
+                # Execute tasks for agents that need to re-run, wave by
+                # wave: agents without a dependency edge between them run
+                # concurrently, waves respect the execution order.
+                for wave in self._rerun_waves(agents_to_rerun):
+                    wave_specs = []
+                    for agent_name in wave:
+                        if agent_name not in agent_specs:
+                            continue
+                        self._log(f"\n  Re-running: {agent_specs[agent_name][0]}")
+                        wave_specs.append(
+                            self._build_agent_task(agents, agent_specs, agent_name, is_iteration=True)
                         )
-                        self.context_manager.update_frontend_code(phase_outputs["frontend_code"])
-                        
-                        if not phase_outputs["frontend_code"].get("success"):
-                            self._log(f"    WARNING: Frontend code re-generation failed")
+
+                    if not wave_specs:
+                        continue
+
+                    wave_outputs = asyncio.run(self._execute_wave(agents, wave_specs))
+                    for spec, output in zip(wave_specs, wave_outputs):
+                        _agent_name, _task, _schema, phase_key, updater = spec
+                        phase_outputs[phase_key] = output
+                        self._dirty_phases.add(phase_key)
+                        updater(output)
+
+                        if not output.get("success"):
+                            self._log(f"    WARNING: {phase_key} re-generation failed")
                 
                 # Run QA after all fixes
                 self._log(f"\n  Re-running: QA Engineer")
@@ -1294,15 +1770,19 @@ RULES:
                     TestReport
                 )
                 self.context_manager.update_test_report(phase_outputs["test_report"])
-                
+                self._dirty_phases.add("test_report")
+
                 results["qa_iterations"] += 1
-                
-                # Save updated outputs (overwrite)
-                self._save_phase_outputs(project_dir, phase_outputs)
+
+                # Save only the phases that re-ran this iteration
+                self._save_phase_outputs(project_dir, phase_outputs, only=self._dirty_phases)
+                self._dirty_phases.clear()
+                self._release_transient()
                 
                 # Log iteration results
                 self._log(f"\n  Iteration {results['qa_iterations']} Results:")
                 self._log_phase_results(phase_outputs)
+                self._flush_log()
             
             # ============================================================
             # FINALIZE
@@ -1372,8 +1852,7 @@ class BaselineCrew:
         self.execution_log = []
 
     def _log(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        log_entry = f"[{time.strftime('%H:%M:%S')}] {message}"
         self.execution_log.append(log_entry)
         if self.verbose:
             print(log_entry)
@@ -1387,8 +1866,7 @@ class BaselineCrew:
         self._log(f"Vibe Prompt: {vibe_prompt}")
         
         # Create output directory
-        safe_name = "".join(c if c.isalnum() or c in ' -_' else '_' for c in vibe_prompt[:30])
-        safe_name = safe_name.strip().replace(' ', '_').lower()
+        safe_name = _UNSAFE_NAME_CHARS.sub('_', vibe_prompt[:30]).strip().replace(' ', '_').lower()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         project_dir = Path(self.output_dir) / f"baseline_{safe_name}_{timestamp}"
         project_dir.mkdir(parents=True, exist_ok=True)
@@ -1426,8 +1904,12 @@ class BaselineCrew:
                 results["error"] = parsed
             
             # Save results
-            with open(project_dir / "baseline_results.json", 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            if orjson is not None:
+                with open(project_dir / "baseline_results.json", 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(project_dir / "baseline_results.json", 'w') as f:
+                    json.dump(results, f, indent=2, default=str)
                 
         except Exception as e:
             results["error"] = str(e)
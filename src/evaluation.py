@@ -7,11 +7,122 @@ Includes expected features verification from VibePrompts dataset
 import os
 import json
 import ast
+import asyncio
+import hashlib
 import re
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - listed in requirements.txt
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional, char-based fallback
+    tiktoken = None
+
+_tiktoken_encoder = None
+
+def _get_encoder():
+    """Lazy cl100k_base encoder; loading its vocabulary is not free."""
+    global _tiktoken_encoder
+    if _tiktoken_encoder is None and tiktoken is not None:
+        _tiktoken_encoder = tiktoken.get_encoding("cl100k_base")
+    return _tiktoken_encoder
+
+def _truncate_code(code: str, max_tokens: int, max_chars: int) -> str:
+    """Truncate a code blob to what the LLM will actually be billed for.
+
+    Characters are a poor proxy for tokens (code runs 2-5 chars/token),
+    so a fixed character cut either wastes budget or overshoots it. With
+    tiktoken available the cut lands exactly on the token budget; without
+    it the old character limit applies.
+    """
+    enc = _get_encoder()
+    if enc is not None:
+        toks = enc.encode(code, disallowed_special=())
+        if len(toks) > max_tokens:
+            return enc.decode(toks[:max_tokens]) + "\n... [truncated]"
+        return code
+    if len(code) > max_chars:
+        return code[:max_chars] + "\n... [truncated]"
+    return code
+
+
+def _dump_json(obj: Any) -> str:
+    """Compact JSON for LLM payloads, C-speed when orjson is available.
+
+    Indentation only inflates the prompt (and its token count) without
+    helping the model, so none is emitted.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, separators=(',', ':'), default=str)
+
+
+def _extract_json(s: str) -> Optional[str]:
+    """Return the first balanced {...} block of s, or None.
+
+    A linear scan with a depth counter (skipping over string literals)
+    replaces the old greedy re.search(r'\\{.*\\}', ..., DOTALL) fallback,
+    which allocated a giant match and could pair the first { with the
+    last } of unrelated trailing prose.
+    """
+    start = s.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(s)):
+        ch = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return s[start:i + 1]
+    return None
+
+
+def _parse_llm_json(response: str) -> Optional[Dict[str, Any]]:
+    """Parse an LLM JSON reply, tolerating surrounding prose."""
+    if not response:
+        return None
+
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        result = loads(response)
+    except ValueError:
+        fragment = _extract_json(response)
+        if fragment is None:
+            return None
+        try:
+            result = loads(fragment)
+        except ValueError:
+            return None
+    return result if isinstance(result, dict) else None
 
 # Load environment variables
 load_dotenv()
@@ -20,36 +131,115 @@ load_dotenv()
 # DeepSeek Client Setup
 # ============================================
 
+# Shared async client; AsyncOpenAI keeps an HTTP connection pool, so
+# building one per call would defeat keep-alive.
+_async_client = None
+
 def get_deepseek_client():
-    """Get OpenAI-compatible client configured for DeepSeek."""
-    from openai import OpenAI
-    
-    api_key = os.getenv("DEEPSEEK_API_KEY")
-    if not api_key:
-        raise ValueError(
-            "DEEPSEEK_API_KEY not found. Please set it in your .env file."
+    """Get the shared async OpenAI-compatible client configured for DeepSeek."""
+    global _async_client
+    if _async_client is None:
+        from openai import AsyncOpenAI
+
+        api_key = os.getenv("DEEPSEEK_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "DEEPSEEK_API_KEY not found. Please set it in your .env file."
+            )
+
+        _async_client = AsyncOpenAI(
+            api_key=api_key,
+            base_url="https://api.deepseek.com"
         )
-    
-    return OpenAI(
-        api_key=api_key,
-        base_url="https://api.deepseek.com"
-    )
+    return _async_client
 
-def llm_call(prompt: str, max_tokens: int = 1000) -> str:
-    """Make a call to DeepSeek API."""
+# Cap on concurrently in-flight evaluator calls, to stay under API rate limits.
+_LLM_CONCURRENCY = 50
+_llm_sem: Optional[asyncio.Semaphore] = None
+_llm_sem_loop = None
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Semaphore for the running loop; recreated if the loop changed."""
+    global _llm_sem, _llm_sem_loop
+    loop = asyncio.get_running_loop()
+    if _llm_sem is None or _llm_sem_loop is not loop:
+        _llm_sem = asyncio.Semaphore(_LLM_CONCURRENCY)
+        _llm_sem_loop = loop
+    return _llm_sem
+
+# Response cache: temperature is pinned to 0.0, so identical prompts get
+# deterministic replies and re-issuing them (reruns after a scoring-logic
+# fix, repeated templates) is pure network and token waste.
+_CACHE_DIR = os.path.expanduser("~/.cache/pentagon_eval")
+_LLM_MEM_CACHE_MAX = 1024
+_llm_mem_cache: Dict[str, str] = {}
+_WS_RE = re.compile(r"\s+")
+
+def _llm_cache_key(prompt: str, max_tokens: int) -> str:
+    """SHA-256 over (model, normalized prompt, max_tokens, temperature)."""
+    # Whitespace-insensitive so reformatted templates still hit.
+    normalized = _WS_RE.sub(" ", prompt).strip()
+    payload = f"deepseek-chat\x00{normalized}\x00{max_tokens}\x000.0"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _llm_cache_get(key: str) -> Optional[str]:
+    """Look up a response in memory first, then on disk."""
+    cached = _llm_mem_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        client = get_deepseek_client()
-        response = client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0.0
-        )
-        return response.choices[0].message.content.strip()
+        with open(os.path.join(_CACHE_DIR, key + ".json"), 'r', encoding='utf-8') as f:
+            response = f.read()
+    except OSError:
+        return None
+    _llm_mem_cache[key] = response
+    return response
+
+def _llm_cache_put(key: str, response: str):
+    """Store a response in memory and atomically on disk (best-effort)."""
+    # Only ever called from the event-loop thread, so plain dict ops are
+    # safe; the default guards against a concurrent evictor all the same.
+    if len(_llm_mem_cache) >= _LLM_MEM_CACHE_MAX:
+        _llm_mem_cache.pop(next(iter(_llm_mem_cache)), None)
+    _llm_mem_cache[key] = response
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        path = os.path.join(_CACHE_DIR, key + ".json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(response)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+async def llm_call_async(prompt: str, max_tokens: int = 1000) -> str:
+    """Make a call to DeepSeek API without blocking other evaluator work."""
+    cache_key = _llm_cache_key(prompt, max_tokens)
+    cached = _llm_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        async with _llm_semaphore():
+            response = await get_deepseek_client().chat.completions.create(
+                model="deepseek-chat",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=0.0
+            )
+        content = response.choices[0].message.content.strip()
+        if content:
+            # Failures (empty replies) are never cached
+            _llm_cache_put(cache_key, content)
+        return content
     except Exception as e:
         print(f"LLM call failed: {e}")
         return ""
 
+def llm_call(prompt: str, max_tokens: int = 1000) -> str:
+    """Synchronous wrapper around llm_call_async for standalone use."""
+    return asyncio.run(llm_call_async(prompt, max_tokens))
+
 # ============================================
 # Load VibePrompts Dataset
 # ============================================
@@ -72,64 +262,102 @@ def load_vibe_prompts(prompts_file: str) -> Dict[str, Dict[str, Any]]:
 def extract_code_content(pentagon_result: Dict[str, Any], baseline_result: Dict[str, Any]) -> Dict[str, str]:
     """Extract all code content from both results."""
     
-    # Pentagon code
-    pentagon_code = ""
+    # Pentagon code; accumulate parts and join once — += on a growing
+    # string is O(n^2) across many files
     phases = pentagon_result.get("phases", {})
-    
+    pentagon_parts = []
+
     # User stories
     user_stories_data = phases.get("user_stories", {}).get("data", {})
-    pentagon_code += f"USER STORIES:\n{json.dumps(user_stories_data, indent=2)}\n\n"
-    
+    pentagon_parts.append(f"USER STORIES:\n{_dump_json(user_stories_data)}\n\n")
+
     # System design
     system_design_data = phases.get("system_design", {}).get("data", {})
-    pentagon_code += f"SYSTEM DESIGN:\n{json.dumps(system_design_data, indent=2)}\n\n"
-    
+    pentagon_parts.append(f"SYSTEM DESIGN:\n{_dump_json(system_design_data)}\n\n")
+
     # Backend
     backend_data = phases.get("backend_code", {}).get("data", {})
     for f in backend_data.get("files", []):
-        pentagon_code += f"BACKEND FILE {f.get('filename', '')}:\n{f.get('content', '')}\n\n"
-    
+        pentagon_parts.append(f"BACKEND FILE {f.get('filename', '')}:\n{f.get('content', '')}\n\n")
+
     # Frontend
     frontend_data = phases.get("frontend_code", {}).get("data", {})
     for f in frontend_data.get("files", []):
-        pentagon_code += f"FRONTEND FILE {f.get('filename', '')}:\n{f.get('content', '')}\n\n"
-    
+        pentagon_parts.append(f"FRONTEND FILE {f.get('filename', '')}:\n{f.get('content', '')}\n\n")
+
     # Test report
     test_report_data = phases.get("test_report", {}).get("data", {})
-    pentagon_code += f"TEST REPORT:\n{json.dumps(test_report_data, indent=2)}\n\n"
-    
+    pentagon_parts.append(f"TEST REPORT:\n{_dump_json(test_report_data)}\n\n")
+
     # Baseline code
-    baseline_code = ""
     output = baseline_result.get("output", {})
-    
-    baseline_code += f"USER STORIES:\n{json.dumps(output.get('user_stories', []), indent=2)}\n\n"
-    baseline_code += f"BACKEND CODE:\n{output.get('backend_code', '')}\n\n"
-    baseline_code += f"FRONTEND CODE:\n{output.get('frontend_code', '')}\n\n"
-    
+    baseline_parts = [
+        f"USER STORIES:\n{_dump_json(output.get('user_stories', []))}\n\n",
+        f"BACKEND CODE:\n{output.get('backend_code', '')}\n\n",
+        f"FRONTEND CODE:\n{output.get('frontend_code', '')}\n\n",
+    ]
+
     return {
-        "pentagon": pentagon_code,
-        "baseline": baseline_code
+        "pentagon": "".join(pentagon_parts),
+        "baseline": "".join(baseline_parts)
     }
 
-def check_feature_keyword_based(feature: str, code: str) -> Dict[str, Any]:
-    """Check if a feature is implemented using keyword matching."""
-    code_lower = code.lower()
-    feature_lower = feature.lower()
-    
+# Compiled once at import; the old code re-ran re.findall with a literal
+# pattern for every feature check.
+_WORD_RE = re.compile(r'\b\w+\b')
+_STOP = frozenset({'the', 'and', 'for', 'with', 'that', 'this'})
+
+@lru_cache(maxsize=4096)
+def _tokenize_feature(feature: str) -> frozenset:
+    """Key terms of a feature description, tokenized once per unique string.
+
+    The same feature list is checked against Pentagon and Baseline (and
+    across prompts in a sweep), so tokenization results are memoized and
+    the stopword test is an O(1) frozenset lookup.
+    """
+    return frozenset(
+        t for t in _WORD_RE.findall(feature.lower())
+        if len(t) > 2 and t not in _STOP
+    )
+
+# One automaton per unique term set; building it is O(total term length)
+# and scanning is a single linear pass over the code.
+_automaton_cache: Dict[frozenset, Any] = {}
+
+def _scan_terms(terms: frozenset, code_lower: str) -> set:
+    """Return the subset of terms present in code_lower.
+
+    With pyahocorasick installed, all terms are found in ONE pass over
+    the code instead of rescanning it once per term; without it, the
+    per-term substring check is kept as a fallback.
+    """
+    if ahocorasick is not None and terms:
+        automaton = _automaton_cache.get(terms)
+        if automaton is None:
+            automaton = ahocorasick.Automaton()
+            for term in terms:
+                automaton.add_word(term, term)
+            automaton.make_automaton()
+            _automaton_cache[terms] = automaton
+        return {term for _, term in automaton.iter(code_lower)}
+    return {t for t in terms if t in code_lower}
+
+def check_feature_keyword_based(feature: str, code: str, hits: Optional[set] = None) -> Dict[str, Any]:
+    """Check if a feature is implemented using keyword matching.
+
+    When hits (the terms already found in the code by a shared scan) is
+    given, the code string is not rescanned at all.
+    """
     # Extract key terms from feature
-    key_terms = re.findall(r'\b\w+\b', feature_lower)
-    key_terms = [t for t in key_terms if len(t) > 2 and t not in ['the', 'and', 'for', 'with', 'that', 'this']]
-    
-    # Check for presence of key terms
-    terms_found = []
-    terms_missing = []
-    
-    for term in key_terms:
-        if term in code_lower:
-            terms_found.append(term)
-        else:
-            terms_missing.append(term)
-    
+    key_terms = _tokenize_feature(feature)
+
+    if hits is None:
+        hits = _scan_terms(key_terms, code.lower())
+
+    # Check for presence of key terms; sorted for deterministic output
+    terms_found = sorted(key_terms & hits)
+    terms_missing = sorted(key_terms - hits)
+
     # Calculate confidence
     if len(key_terms) == 0:
         confidence = 0.5
@@ -147,13 +375,71 @@ def check_feature_keyword_based(feature: str, code: str) -> Dict[str, Any]:
         "terms_missing": terms_missing
     }
 
-def check_features_llm_based(features: List[str], code: str, max_code_length: int = 12000) -> List[Dict[str, Any]]:
+# Compiled matchers per unique feature tuple; a VibePrompts entry's
+# feature list is reused for Pentagon + Baseline and across runs, so the
+# codegen cost is paid once.
+_matcher_cache: Dict[Tuple[str, ...], Any] = {}
+
+def compile_feature_matcher(features: Tuple[str, ...]):
+    """Generate a specialized matcher function for one feature list.
+
+    The emitted source hard-codes each feature's term set and the
+    confidence denominator as constants, so running the matcher is one
+    shared scan of the code plus straight-line set arithmetic — no
+    per-call tokenization, threshold lookups or interpretive dispatch.
+    """
+    matcher = _matcher_cache.get(features)
+    if matcher is not None:
+        return matcher
+
+    term_sets = [_tokenize_feature(f) for f in features]
+    namespace = {
+        "_scan": _scan_terms,
+        "_ALL": frozenset().union(*term_sets) if term_sets else frozenset(),
+    }
+
+    lines = [
+        "def _matcher(code_lower):",
+        "    hits = _scan(_ALL, code_lower)",
+        "    res = []",
+    ]
+    for i, (feature, terms) in enumerate(zip(features, term_sets)):
+        namespace[f"_F{i}"] = feature
+        namespace[f"_T{i}"] = terms
+        if terms:
+            lines.append(f"    found = sorted(_T{i} & hits)")
+            lines.append(f"    conf = round(len(found) / {len(terms)}, 2)")
+        else:
+            lines.append("    found = []")
+            lines.append("    conf = 0.5")
+        lines.append("    impl = conf >= 0.6")
+        lines.append(
+            f"    res.append({{'feature': _F{i}, 'implemented': impl,"
+            f" 'confidence': conf, 'terms_found': found,"
+            f" 'terms_missing': sorted(_T{i} - hits), 'method': 'keyword',"
+            f" 'status': 'implemented' if impl else 'not_implemented'}})"
+        )
+    lines.append("    return res")
+
+    exec(compile("\n".join(lines), "<feature-matcher>", "exec"), namespace)
+    matcher = namespace["_matcher"]
+    _matcher_cache[features] = matcher
+    return matcher
+
+def _keyword_feature_results(expected_features: List[str], code_lower: str) -> List[Dict[str, Any]]:
+    """Keyword-check all expected features with a single scan of the code.
+
+    code_lower must already be lowercased; callers do that once per blob
+    rather than allocating a fresh copy inside every check.
+    """
+    return compile_feature_matcher(tuple(expected_features))(code_lower)
+
+async def check_features_llm_based(features: List[str], code: str, max_code_length: int = 12000) -> List[Dict[str, Any]]:
     """Use LLM to check if features are implemented."""
     
-    # Truncate code if too long
-    if len(code) > max_code_length:
-        code = code[:max_code_length] + "\n... [truncated]"
-    
+    # Truncate code if too long; token budget derived from the char cap
+    code = _truncate_code(code, max_code_length // 4, max_code_length)
+
     features_list = "\n".join([f"{i+1}. {f}" for i, f in enumerate(features)])
     
     prompt = f"""Analyze the following code and determine which features are implemented.
@@ -178,25 +464,74 @@ Respond in this exact JSON format:
     ]
 }}"""
     
-    response = llm_call(prompt, max_tokens=2000)
-    
-    try:
-        result = json.loads(response)
+    response = await llm_call_async(prompt, max_tokens=2000)
+
+    result = _parse_llm_json(response)
+    if result is not None:
         return result.get("features", [])
-    except json.JSONDecodeError:
-        # Try to extract JSON
-        match = re.search(r'\{.*\}', response, re.DOTALL)
-        if match:
-            try:
-                result = json.loads(match.group())
-                return result.get("features", [])
-            except:
-                pass
-        
-        # Fallback to keyword-based
-        return []
 
-def evaluate_expected_features(
+    # Fallback to keyword-based
+    return []
+
+async def check_features_both(
+    features: List[str],
+    pentagon_code: str,
+    baseline_code: str,
+    max_code_length: int = 12000
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Check feature implementation for both code bases in ONE LLM request.
+
+    Scoring Pentagon and Baseline separately resends the expected-feature
+    list and pays two network round trips; a single fused prompt halves
+    the request count and the feature-list token traffic.
+    """
+
+    # Truncate each blob independently, same policy as the single check
+    pentagon_code = _truncate_code(pentagon_code, max_code_length // 4, max_code_length)
+    baseline_code = _truncate_code(baseline_code, max_code_length // 4, max_code_length)
+
+    features_list = "\n".join([f"{i+1}. {f}" for i, f in enumerate(features)])
+
+    prompt = f"""Analyze the two implementations below and determine which features each one implements.
+
+EXPECTED FEATURES:
+{features_list}
+
+CODE A (Pentagon):
+```
+{pentagon_code}
+```
+
+CODE B (Baseline):
+```
+{baseline_code}
+```
+
+For each feature and each implementation, determine if it is:
+- "implemented": fully or partially implemented in the code
+- "not_implemented": not found in the code
+- "partial": some aspects present but incomplete
+
+Respond in this exact JSON format:
+{{
+    "pentagon": [
+        {{"feature": "feature text", "status": "implemented/not_implemented/partial", "evidence": "brief explanation"}}
+    ],
+    "baseline": [
+        {{"feature": "feature text", "status": "implemented/not_implemented/partial", "evidence": "brief explanation"}}
+    ]
+}}"""
+
+    response = await llm_call_async(prompt, max_tokens=3000)
+
+    result = _parse_llm_json(response)
+    if result is not None:
+        return result.get("pentagon", []), result.get("baseline", [])
+
+    # Fallback to keyword-based
+    return [], []
+
+async def evaluate_expected_features(
     prompt_id: str,
     pentagon_result: Dict[str, Any],
     baseline_result: Dict[str, Any],
@@ -221,49 +556,39 @@ def evaluate_expected_features(
     # Extract code content
     code_content = extract_code_content(pentagon_result, baseline_result)
     
-    # Evaluate Pentagon
+    # Evaluate Pentagon and Baseline; both share the expected-feature
+    # list, so one fused request scores the two code bases together.
     pentagon_features = []
-    if use_llm:
-        llm_results = check_features_llm_based(expected_features, code_content["pentagon"])
-        if llm_results:
-            for llm_result in llm_results:
-                pentagon_features.append({
-                    "feature": llm_result.get("feature", ""),
-                    "implemented": llm_result.get("status") in ["implemented", "partial"],
-                    "status": llm_result.get("status", "unknown"),
-                    "evidence": llm_result.get("evidence", ""),
-                    "method": "llm"
-                })
-    
-    # Fallback or supplement with keyword-based
-    if not pentagon_features:
-        for feature in expected_features:
-            result = check_feature_keyword_based(feature, code_content["pentagon"])
-            result["method"] = "keyword"
-            result["status"] = "implemented" if result["implemented"] else "not_implemented"
-            pentagon_features.append(result)
-    
-    # Evaluate Baseline
     baseline_features = []
     if use_llm:
-        llm_results = check_features_llm_based(expected_features, code_content["baseline"])
-        if llm_results:
-            for llm_result in llm_results:
-                baseline_features.append({
-                    "feature": llm_result.get("feature", ""),
-                    "implemented": llm_result.get("status") in ["implemented", "partial"],
-                    "status": llm_result.get("status", "unknown"),
-                    "evidence": llm_result.get("evidence", ""),
-                    "method": "llm"
-                })
-    
+        pentagon_llm, baseline_llm = await check_features_both(
+            expected_features, code_content["pentagon"], code_content["baseline"]
+        )
+        for llm_result in pentagon_llm:
+            pentagon_features.append({
+                "feature": llm_result.get("feature", ""),
+                "implemented": llm_result.get("status") in ["implemented", "partial"],
+                "status": llm_result.get("status", "unknown"),
+                "evidence": llm_result.get("evidence", ""),
+                "method": "llm"
+            })
+        for llm_result in baseline_llm:
+            baseline_features.append({
+                "feature": llm_result.get("feature", ""),
+                "implemented": llm_result.get("status") in ["implemented", "partial"],
+                "status": llm_result.get("status", "unknown"),
+                "evidence": llm_result.get("evidence", ""),
+                "method": "llm"
+            })
+
+    # Fallback or supplement with keyword-based; each blob is lowercased
+    # exactly once here, not per feature check
+    if not pentagon_features:
+        pentagon_features = _keyword_feature_results(expected_features, code_content["pentagon"].lower())
+
     # Fallback or supplement with keyword-based
     if not baseline_features:
-        for feature in expected_features:
-            result = check_feature_keyword_based(feature, code_content["baseline"])
-            result["method"] = "keyword"
-            result["status"] = "implemented" if result["implemented"] else "not_implemented"
-            baseline_features.append(result)
+        baseline_features = _keyword_feature_results(expected_features, code_content["baseline"].lower())
     
     # Calculate statistics
     pentagon_implemented = sum(1 for f in pentagon_features if f.get("implemented", False))
@@ -364,40 +689,79 @@ def evaluate_baseline_pipeline(baseline_result: Dict[str, Any]) -> Dict[str, Any
 # 3. Code Executability Evaluation
 # ============================================
 
+# Validity results per unique file content; the same files come back on
+# repeated evaluation runs, and re-running ast.parse on them is wasted
+# CPU. Keyed by content digest so the strings themselves are not kept.
+_syntax_cache: Dict[bytes, Dict[str, Any]] = {}
+_html_cache: Dict[bytes, Dict[str, Any]] = {}
+_STRUCTURE_CACHE_MAX = 2048
+# The structure checks run in worker threads (asyncio.to_thread), so
+# eviction must be serialized: two threads hitting the cap at once would
+# otherwise race on pop/iteration.
+_structure_cache_lock = threading.Lock()
+
+def _content_key(code: str) -> bytes:
+    return hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+
+def _cache_structure_result(cache: Dict[bytes, Dict[str, Any]], key: bytes, result: Dict[str, Any]) -> Dict[str, Any]:
+    with _structure_cache_lock:
+        if len(cache) >= _STRUCTURE_CACHE_MAX:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = result
+    return result
+
 def check_python_syntax(code: str) -> Dict[str, Any]:
     """Check Python code for syntax errors."""
     if not code or not code.strip():
         return {"valid": False, "error": "Empty code"}
+
+    key = _content_key(code)
+    cached = _syntax_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         ast.parse(code)
-        return {"valid": True, "error": None}
+        result = {"valid": True, "error": None}
     except SyntaxError as e:
-        return {"valid": False, "error": str(e)}
+        result = {"valid": False, "error": str(e)}
+    return _cache_structure_result(_syntax_cache, key, result)
 
 def check_html_structure(code: str) -> Dict[str, Any]:
     """Check HTML code for basic structure."""
     if not code or not code.strip():
         return {"valid": False, "issues": ["Empty code"]}
-    
+
+    key = _content_key(code)
+    cached = _html_cache.get(key)
+    if cached is not None:
+        return cached
+
     issues = []
+    # One lowercased copy; tag presence and script balance all come from
+    # C-level str operations on it instead of per-tag regex scans. With
+    # the digest cache above, each unique file pays this a single time,
+    # so a compiled (numba-style) scan kernel would only add a heavy
+    # dependency and JIT warm-up to a path that is already memchr-bound.
     code_lower = code.lower()
-    
+
     if "<html" not in code_lower:
         issues.append("Missing <html> tag")
     if "<head" not in code_lower:
         issues.append("Missing <head> tag")
     if "<body" not in code_lower:
         issues.append("Missing <body> tag")
-    
-    script_opens = len(re.findall(r'<script[^>]*>', code, re.IGNORECASE))
-    script_closes = len(re.findall(r'</script>', code, re.IGNORECASE))
+
+    script_closes = code_lower.count('</script')
+    script_opens = code_lower.count('<script')
     if script_opens != script_closes:
         issues.append(f"Mismatched script tags: {script_opens} opens, {script_closes} closes")
-    
-    return {
+
+    result = {
         "valid": len(issues) == 0,
         "issues": issues
     }
+    return _cache_structure_result(_html_cache, key, result)
 
 def evaluate_pentagon_executability(pentagon_result: Dict[str, Any]) -> Dict[str, Any]:
     """Evaluate code executability for Pentagon output."""
@@ -527,15 +891,17 @@ def evaluate_user_stories(pentagon_result: Dict[str, Any], baseline_result: Dict
     def analyze_stories(stories: List[Dict]) -> Dict[str, Any]:
         if not stories:
             return {"count": 0, "has_priorities": False, "has_descriptions": False}
-        
-        has_priorities = all("priority" in s for s in stories)
-        has_descriptions = all("description" in s and len(s.get("description", "")) > 10 for s in stories)
-        has_ids = all("id" in s for s in stories)
-        
-        priority_counts = defaultdict(int)
+
+        # One fused pass updates every flag and counter, instead of three
+        # all() sweeps plus a fourth loop for the priority distribution.
+        has_priorities = has_descriptions = has_ids = True
+        priority_counts = Counter()
         for s in stories:
+            has_priorities &= "priority" in s
+            has_descriptions &= "description" in s and len(s.get("description", "")) > 10
+            has_ids &= "id" in s
             priority_counts[s.get("priority", "unknown")] += 1
-        
+
         return {
             "count": len(stories),
             "has_priorities": has_priorities,
@@ -577,10 +943,10 @@ def evaluate_system_design(pentagon_result: Dict[str, Any]) -> Dict[str, Any]:
             "fields_count": len(model.get("fields", []))
         })
     
-    endpoint_methods = defaultdict(int)
-    for ep in endpoints:
-        endpoint_methods[ep.get("method", "UNKNOWN")] += 1
-    
+    # Counter over a generator counts in C (_count_elements) instead of
+    # a Python-level dict update per endpoint
+    endpoint_methods = Counter(ep.get("method", "UNKNOWN") for ep in endpoints)
+
     return {
         "has_design": True,
         "models_count": len(models),
@@ -622,7 +988,7 @@ def evaluate_efficiency(pentagon_result: Dict[str, Any], baseline_result: Dict[s
 # 8. Code Quality Evaluation (LLM-based)
 # ============================================
 
-def evaluate_code_quality_llm(prompt: str, pentagon_result: Dict[str, Any], baseline_result: Dict[str, Any]) -> Dict[str, Any]:
+async def evaluate_code_quality_llm(prompt: str, pentagon_result: Dict[str, Any], baseline_result: Dict[str, Any]) -> Dict[str, Any]:
     """Use LLM to evaluate code quality."""
     
     pentagon_phases = pentagon_result.get("phases", {})
@@ -645,17 +1011,17 @@ def evaluate_code_quality_llm(prompt: str, pentagon_result: Dict[str, Any], base
 
 REQUIREMENT: {prompt}
 
-PENTAGON BACKEND (first 3000 chars):
-{pentagon_backend[:3000]}
+PENTAGON BACKEND (truncated):
+{_truncate_code(pentagon_backend, 750, 3000)}
 
-PENTAGON FRONTEND (first 3000 chars):
-{pentagon_frontend[:3000]}
+PENTAGON FRONTEND (truncated):
+{_truncate_code(pentagon_frontend, 750, 3000)}
 
-BASELINE BACKEND (first 3000 chars):
-{baseline_backend[:3000]}
+BASELINE BACKEND (truncated):
+{_truncate_code(baseline_backend, 750, 3000)}
 
-BASELINE FRONTEND (first 3000 chars):
-{baseline_frontend[:3000]}
+BASELINE FRONTEND (truncated):
+{_truncate_code(baseline_frontend, 750, 3000)}
 
 Rate each on a scale of 1-10:
 1. Code structure (organization, modularity)
@@ -681,98 +1047,133 @@ Respond in this exact JSON format:
     }}
 }}"""
     
-    response = llm_call(evaluation_prompt, max_tokens=800)
-    
-    try:
-        result = json.loads(response)
+    response = await llm_call_async(evaluation_prompt, max_tokens=800)
+
+    result = _parse_llm_json(response)
+    if result is not None:
         for key in ["pentagon", "baseline"]:
             if key in result:
                 scores = [result[key].get(m, 5) for m in ["code_structure", "readability", "api_design", "error_handling"]]
                 result[key]["average"] = round(sum(scores) / len(scores), 2)
         return result
-    except json.JSONDecodeError:
-        match = re.search(r'\{.*\}', response, re.DOTALL)
-        if match:
-            try:
-                result = json.loads(match.group())
-                for key in ["pentagon", "baseline"]:
-                    if key in result:
-                        scores = [result[key].get(m, 5) for m in ["code_structure", "readability", "api_design", "error_handling"]]
-                        result[key]["average"] = round(sum(scores) / len(scores), 2)
-                return result
-            except:
-                pass
-        return {
-            "pentagon": {"average": 5, "notes": "Could not parse evaluation"},
-            "baseline": {"average": 5, "notes": "Could not parse evaluation"}
-        }
+
+    return {
+        "pentagon": {"average": 5, "notes": "Could not parse evaluation"},
+        "baseline": {"average": 5, "notes": "Could not parse evaluation"}
+    }
 
 # ============================================
 # 9. Single Prompt Comprehensive Evaluation
 # ============================================
 
-def evaluate_single_prompt(
+async def evaluate_single_prompt(
     prompt_result: Dict[str, Any],
     vibe_prompts: Dict[str, Dict[str, Any]],
     use_llm: bool = True
 ) -> Dict[str, Any]:
     """Comprehensive evaluation for a single prompt result."""
-    
+
     prompt = prompt_result.get("prompt", "")
     prompt_id = prompt_result.get("prompt_id", "unknown")
     complexity = prompt_result.get("complexity", "unknown")
-    
+
     pentagon = prompt_result.get("pentagon", {})
     baseline = prompt_result.get("baseline", {})
-    
+
+    # All evaluator LLM round trips for this prompt fire concurrently,
+    # and the CPU-bound syntax/structure checks run in worker threads
+    # during the network wait instead of after it — the feature check,
+    # the quality rating and the two executability passes are all
+    # independent of each other.
+    if use_llm:
+        expected_features, code_quality, exec_pentagon, exec_baseline = await asyncio.gather(
+            evaluate_expected_features(prompt_id, pentagon, baseline, vibe_prompts, use_llm),
+            evaluate_code_quality_llm(prompt, pentagon, baseline),
+            asyncio.to_thread(evaluate_pentagon_executability, pentagon),
+            asyncio.to_thread(evaluate_baseline_executability, baseline),
+            return_exceptions=True,
+        )
+        if isinstance(expected_features, BaseException):
+            raise expected_features
+        if isinstance(exec_pentagon, BaseException):
+            raise exec_pentagon
+        if isinstance(exec_baseline, BaseException):
+            raise exec_baseline
+        if isinstance(code_quality, BaseException):
+            code_quality = {"error": str(code_quality)}
+    else:
+        expected_features = await evaluate_expected_features(
+            prompt_id, pentagon, baseline, vibe_prompts, use_llm
+        )
+        code_quality = None
+        exec_pentagon = evaluate_pentagon_executability(pentagon)
+        exec_baseline = evaluate_baseline_executability(baseline)
+
     evaluation = {
         "prompt_id": prompt_id,
         "prompt": prompt[:100] + "..." if len(prompt) > 100 else prompt,
         "complexity": complexity,
         "timestamp": datetime.now().isoformat(),
-        
+
         # 1. Expected Features (NEW - Primary metric)
-        "expected_features": evaluate_expected_features(
-            prompt_id, pentagon, baseline, vibe_prompts, use_llm
-        ),
-        
+        "expected_features": expected_features,
+
         # 2. Pipeline Success
         "pipeline": {
             "pentagon": evaluate_pentagon_pipeline(pentagon),
             "baseline": evaluate_baseline_pipeline(baseline)
         },
-        
+
         # 3. Code Executability
         "executability": {
-            "pentagon": evaluate_pentagon_executability(pentagon),
-            "baseline": evaluate_baseline_executability(baseline)
+            "pentagon": exec_pentagon,
+            "baseline": exec_baseline
         },
-        
+
         # 4. QA Results (Pentagon only)
         "qa_results": evaluate_qa_results(pentagon),
-        
+
         # 5. User Stories
         "user_stories": evaluate_user_stories(pentagon, baseline),
-        
+
         # 6. System Design (Pentagon only)
         "system_design": evaluate_system_design(pentagon),
-        
+
         # 7. Efficiency
         "efficiency": evaluate_efficiency(pentagon, baseline)
     }
-    
+
     # 8. LLM-based code quality (optional)
     if use_llm:
-        try:
-            evaluation["code_quality_llm"] = evaluate_code_quality_llm(prompt, pentagon, baseline)
-        except Exception as e:
-            evaluation["code_quality_llm"] = {"error": str(e)}
-    
+        evaluation["code_quality_llm"] = code_quality
+
     # Calculate summary scores
     evaluation["summary"] = calculate_summary_scores(evaluation)
-    
+
     return evaluation
 
+async def evaluate_all(
+    prompt_results: List[Dict[str, Any]],
+    vibe_prompts: Dict[str, Dict[str, Any]],
+    use_llm: bool = True,
+    max_concurrency: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Evaluate many prompt results concurrently.
+
+    Each prompt is an independent bundle of LLM round trips plus syntax
+    checks, so running them together drops the wall clock to roughly the
+    slowest single prompt instead of the sum. The per-prompt gate bounds
+    the CPU-side work in flight; total LLM requests are capped separately
+    by llm_call_async's semaphore.
+    """
+    gate = asyncio.Semaphore(max_concurrency or os.cpu_count() or 8)
+
+    async def _one(prompt_result: Dict[str, Any]) -> Dict[str, Any]:
+        async with gate:
+            return await evaluate_single_prompt(prompt_result, vibe_prompts, use_llm=use_llm)
+
+    return list(await asyncio.gather(*(_one(p) for p in prompt_results)))
+
 # ============================================
 # 10. Summary Score Calculation
 # ============================================
@@ -863,19 +1264,18 @@ def evaluate_full_experiment(
     print(f"\nEvaluating {total_prompts} prompts...")
     print(f"Expected features loaded: {len(vibe_prompts)} prompts")
     
-    prompt_evaluations = []
-    
-    for i, prompt_result in enumerate(results):
-        prompt_id = prompt_result.get("prompt_id", f"P{i+1}")
-        print(f"\n[{i+1}/{total_prompts}] Evaluating {prompt_id}...")
-        
-        evaluation = evaluate_single_prompt(prompt_result, vibe_prompts, use_llm=use_llm)
-        prompt_evaluations.append(evaluation)
-        
+    # All prompts are evaluated concurrently under one event loop; order
+    # of the returned list matches the input order.
+    prompt_evaluations = asyncio.run(evaluate_all(results, vibe_prompts, use_llm=use_llm))
+
+    for i, evaluation in enumerate(prompt_evaluations):
+        prompt_id = evaluation.get("prompt_id", f"P{i+1}")
+        print(f"\n[{i+1}/{total_prompts}] {prompt_id}")
+
         # Print quick summary
         summary = evaluation["summary"]
         features = evaluation["expected_features"]
-        
+
         print(f"  Expected Features: Pentagon {features['pentagon']['percentage']:.1f}% vs Baseline {features['baseline']['percentage']:.1f}%")
         print(f"  Composite Score:   Pentagon {summary['pentagon']['composite_score']:.3f} vs Baseline {summary['baseline']['composite_score']:.3f}")
         print(f"  Winner: {'Pentagon' if summary['comparison']['pentagon_wins'] else 'Baseline'}")
@@ -1201,10 +1601,20 @@ def run_evaluation(
         Complete evaluation report
     """
     
-    # Load experiment data
+    # Load experiment data. run_experiment streams results as NDJSON (one
+    # comparison per line); wrap those lines back into the {"results": [...]}
+    # shape evaluate_full_experiment expects. Legacy aggregate .json files
+    # still load as a single document.
     print(f"Loading experiment data from: {experiment_json_path}")
-    with open(experiment_json_path, 'r', encoding='utf-8') as f:
-        experiment_data = json.load(f)
+    loads = orjson.loads if orjson is not None else json.loads
+    if experiment_json_path.endswith(".ndjson"):
+        with open(experiment_json_path, 'rb') as f:
+            experiment_data = {
+                "results": [loads(line) for line in f if line.strip()]
+            }
+    else:
+        with open(experiment_json_path, 'r', encoding='utf-8') as f:
+            experiment_data = json.load(f)
     
     # Load VibePrompts
     print(f"Loading VibePrompts from: {prompts_json_path}")
@@ -1217,10 +1627,15 @@ def run_evaluation(
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
-    # Save evaluation report
+    # Save evaluation report; orjson serializes the multi-MB bundle at
+    # C speed, with the stdlib encoder as fallback
     report_path = os.path.join(output_dir, "evaluation_report.json")
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(evaluation_report, f, indent=2, default=str)
+    if orjson is not None:
+        with open(report_path, 'wb') as f:
+            f.write(orjson.dumps(evaluation_report, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(evaluation_report, f, indent=2, default=str)
     print(f"\nEvaluation report saved to: {report_path}")
     
     # Generate thesis tables
@@ -1262,6 +1677,8 @@ if __name__ == "__main__":
         experiment_path = sys.argv[1]
         prompts_path = sys.argv[2]
     else:
+        # The committed artifact from the last full run is the legacy
+        # aggregate document; new runs produce .ndjson, which loads too.
         experiment_path = r"output\full_experiment_20260119_004837.json"
         prompts_path = "data/prompts/vibe_prompts.json"
     